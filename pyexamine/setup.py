@@ -7,7 +7,7 @@ setup(
     package_dir={"": "src"},
     install_requires=[
         "astroid",
-        "networkx",
+        "networkx>=3.1",
         "pyyaml",
         "pytest",
     ],
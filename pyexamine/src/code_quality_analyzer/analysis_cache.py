@@ -0,0 +1,111 @@
+import os
+import sys
+import pickle
+import hashlib
+import logging
+import tempfile
+from functools import lru_cache
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = '.pyexamine_cache'
+
+# Bump whenever the layout of the cached facts or the detectors' results change
+CACHE_VERSION = 8
+
+@lru_cache(maxsize=1024)
+def _read_entry(path):
+    """
+    Read the raw bytes of a cache entry.
+
+    Entries are content addressed and never rewritten with different data, so
+    the bytes can be kept in memory for the rest of the process. Misses raise
+    and are therefore not memoized.
+    """
+    with open(path, 'rb') as entry:
+        return entry.read()
+
+class AnalysisCache:
+    """
+    Persistent cache of facts extracted from source files, keyed by a hash of their content.
+
+    Entries live under ``cache_dir/<namespace>/<key[:2]>/<key>`` and are written
+    atomically, so concurrent worker processes can share the same cache directory.
+
+    Attributes:
+        cache_dir (str): The root directory of the cache.
+        namespace (str): Separates the entries of different detectors.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, namespace='default'):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str, optional): The root directory of the cache.
+            namespace (str, optional): Separates the entries of different detectors.
+        """
+        self.cache_dir = cache_dir
+        self.namespace = namespace
+
+    def key(self, source):
+        """
+        Compute the cache key of a source file.
+
+        The key also covers the cache version and the Python version, since the
+        extracted facts depend on the ast module.
+
+        Args:
+            source (bytes): The raw content of the source file.
+
+        Returns:
+            str: The hexadecimal cache key.
+        """
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update(f"{self.namespace}:{CACHE_VERSION}:{sys.version_info[:2]}:".encode())
+        digest.update(source)
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        return os.path.join(self.cache_dir, self.namespace, key[:2], key)
+
+    def get(self, key):
+        """
+        Load a cached value.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            object: The cached value, or None on a miss or an unreadable entry.
+        """
+        try:
+            return pickle.loads(_read_entry(self._entry_path(key)))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable cache entry {key}: {str(e)}")
+            return None
+
+    def put(self, key, value):
+        """
+        Store a value in the cache. Failures are logged and otherwise ignored.
+
+        Args:
+            key (str): The cache key.
+            value (object): A picklable value.
+        """
+        path = self._entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as entry:
+                    pickle.dump(value, entry, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write cache entry {path}: {str(e)}")
@@ -1,17 +1,57 @@
 import os
 import ast
 import networkx as nx
-from collections import defaultdict
-import yaml
+from collections import Counter, defaultdict, deque
+from functools import lru_cache
 from dataclasses import dataclass
 import sys
 import importlib.util
 import logging
 from .exceptions import CodeAnalysisError
+from .config_handler import read_config
+from .fact_loader import PARALLEL_CHUNKSIZE, PARALLEL_MIN_FILES, parse_files
+from .file_utils import DEFAULT_MAX_FILE_SIZE, iter_python_files, should_skip_file
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Common infrastructure modules, which are not reported as hubs
+_HUB_EXCLUDED_PATTERNS = ('util', 'common', 'base', 'core')
+
+# Functions that do not count towards god objects: private methods and common test/setup functions
+_GOD_OBJECT_EXCLUDED_PREFIXES = ('_', 'test_', 'setup_', 'config_')
+
+def _node_subclasses(node_class):
+    """Get a node class and all of its subclasses."""
+    classes = {node_class}
+    for subclass in node_class.__subclasses__():
+        classes |= _node_subclasses(subclass)
+    return classes
+
+# Nodes that cannot have an import, a function definition or a call below them
+_LEAF_NODE_TYPES = frozenset().union(*map(_node_subclasses, (
+    ast.Name, ast.Constant, ast.alias, ast.expr_context,
+    ast.operator, ast.boolop, ast.unaryop, ast.cmpop,
+)))
+
+def _walk_without_leaves(tree):
+    """
+    Yield the nodes of a tree in the same breadth-first order as ast.walk, leaving
+    out the leaf nodes of _LEAF_NODE_TYPES, which make up most of a typical tree.
+    """
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        yield node
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for item in value:
+                    if type(item) not in _LEAF_NODE_TYPES and isinstance(item, ast.AST):
+                        todo.append(item)
+            elif type(value) not in _LEAF_NODE_TYPES and isinstance(value, ast.AST):
+                todo.append(value)
+
 @dataclass
 class ArchitecturalSmell:
     name: str
@@ -21,6 +61,123 @@ class ArchitecturalSmell:
     line_number: int = None
     severity: str = 'medium'
 
+@dataclass
+class ModuleFacts:
+    """
+    Architectural information extracted from a single Python file.
+
+    Imports are kept as written, as (module, level, line_number, imported_names)
+    tuples, so that the facts do not depend on where the file lives and can be
+    cached by content.
+
+    Attributes:
+        file_path (str): The path to the file.
+        imports (list): The import statements, in traversal order.
+        functions (list): Names of the functions defined in the file, in traversal order.
+        import_offsets (list): For each import, the number of functions found before it,
+            so that merging can replay imports and functions in traversal order.
+        api_calls (Counter): The number of method calls of each attribute name.
+        module_calls (list): (module, function) pairs of calls on imported modules.
+    """
+    file_path: str
+    imports: list
+    functions: list
+    import_offsets: list
+    api_calls: Counter
+    module_calls: list
+
+def _extract_module_facts(file_path, cache=None):
+    """
+    Parse a Python file and extract its architectural information.
+
+    When a cache is given, the facts are looked up by the hash of the file
+    content before parsing, and stored after a miss.
+
+    Args:
+        file_path (str): The path to the Python file to be analyzed.
+        cache (AnalysisCache, optional): The cache of previously extracted facts.
+
+    Returns:
+        ModuleFacts: The information extracted from the file.
+
+    Raises:
+        SyntaxError: If the file cannot be parsed.
+    """
+    with open(file_path, 'rb') as file:
+        source = file.read()
+
+    if cache is not None:
+        cache_key = cache.key(source)
+        facts = cache.get(cache_key)
+        if facts is not None:
+            facts.file_path = file_path
+            return facts
+
+    # Parsing the bytes lets ast handle the encoding, the file name goes into syntax errors
+    tree = ast.parse(source, filename=file_path)
+    facts = ModuleFacts(file_path=file_path, imports=[], functions=[], import_offsets=[],
+                        api_calls=None, module_calls=[])
+    api_calls = []
+    # Last components of the names imported so far, for calls on imported modules
+    imported_modules = set()
+
+    # Dispatch on the exact node type, calls first as they are by far the most
+    # frequent of the nodes of interest
+    for node in _walk_without_leaves(tree):
+        node_type = type(node)
+        if node_type is ast.Call:
+            func = node.func
+            if type(func) is ast.Attribute:
+                api_calls.append(func.attr)
+
+                # Track function calls between modules
+                if type(func.value) is ast.Name and func.value.id in imported_modules:
+                    facts.module_calls.append((func.value.id, func.attr))
+
+        elif node_type is ast.Import:
+            for alias in node.names:
+                facts.imports.append((alias.name, 0, node.lineno, ()))
+                facts.import_offsets.append(len(facts.functions))
+                imported_modules.add(alias.name.split('.')[-1])
+
+        elif node_type is ast.ImportFrom:
+            if node.module:
+                imported_names = tuple(alias.name for alias in node.names if alias.name != '*')
+                facts.imports.append((node.module, node.level, node.lineno, imported_names))
+                facts.import_offsets.append(len(facts.functions))
+                imported_modules.add(node.module.split('.')[-1])
+
+        elif node_type is ast.FunctionDef:
+            facts.functions.append(node.name)
+    # The tree can be large for generated modules, do not keep it while the facts are cached
+    del tree, node
+
+    # Only the number of calls of each attribute is kept, in the order of their first call
+    facts.api_calls = Counter(api_calls)
+
+    if cache is not None:
+        cache.put(cache_key, facts)
+    return facts
+
+@lru_cache(maxsize=None)
+def _is_installed_package(top_level):
+    """
+    Check whether a top-level package can be imported.
+
+    find_spec searches sys.path, and the same few packages are imported by
+    most modules of a project, so the result is memoized per package name.
+
+    Args:
+        top_level (str): The top-level package name.
+
+    Returns:
+        bool: True if the package is found, False otherwise.
+    """
+    try:
+        return importlib.util.find_spec(top_level) is not None
+    except (ModuleNotFoundError, ValueError):
+        return False
+
 class ArchitecturalSmellDetector:
     """
     A class to detect architectural smells in Python projects.
@@ -32,30 +189,48 @@ class ArchitecturalSmellDetector:
         architectural_smells (list): A list to store detected architectural smells.
         module_dependencies (nx.DiGraph): A directed graph to represent module dependencies.
         module_functions (defaultdict): A dictionary to store functions for each module.
-        api_usage (defaultdict): A dictionary to store API usage for each module.
+        function_to_modules (defaultdict): The modules of each function name, in the
+            order the function was added to them.
+        api_usage (defaultdict): A Counter of the called API attributes of each module.
         thresholds (dict): A dictionary of threshold values for various smell detections.
         file_paths (dict): A dictionary to store file paths for each module.
         external_dependencies (dict): A dictionary to store external dependencies for each module.
         function_calls (defaultdict): A dictionary to track inter-module function calls.
+        jobs (int): The number of worker processes used to parse files.
+        cache_dir (str): The directory of the on-disk facts cache, or None to disable it.
     """
 
-    def __init__(self, thresholds):
+    PARALLEL_MIN_FILES = PARALLEL_MIN_FILES
+    PARALLEL_CHUNKSIZE = PARALLEL_CHUNKSIZE
+
+    def __init__(self, thresholds, jobs=None, cache_dir=None):
         """
         Initialize the ArchitecturalSmellDetector with given thresholds.
 
         Args:
             thresholds (dict): A dictionary of threshold values for various smell detections.
+            jobs (int, optional): The number of worker processes used to parse files
+                (default: the number of CPUs). Use 1 to parse in-process.
+            cache_dir (str, optional): Directory where the facts extracted from each file
+                are cached, keyed by file content. Caching is disabled when None.
         """
         self.architectural_smells = []
         self.module_dependencies = nx.DiGraph()
         self.module_functions = defaultdict(set)
-        self.api_usage = defaultdict(list)
+        self.function_to_modules = defaultdict(list)
+        # Public functions of each module, as counted by detect_god_objects
+        self._public_function_counts = Counter()
+        self.api_usage = defaultdict(Counter)
         self.thresholds = thresholds
         self.file_paths = {}  # New attribute to store file paths
         self.external_dependencies = defaultdict(set)
         self.function_calls = defaultdict(set)  # Track inter-module function calls
+        self._degrees = None
+        self.jobs = jobs or os.cpu_count() or 1
+        self.cache_dir = cache_dir
 
-    def load_thresholds(self, config_path):
+    @staticmethod
+    def load_thresholds(config_path):
         """
         Load threshold values from a YAML configuration file.
 
@@ -65,8 +240,7 @@ class ArchitecturalSmellDetector:
         Returns:
             dict: A dictionary of threshold values for architectural smells.
         """
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
+        config = read_config(config_path)
         return {k: v['value'] for k, v in config['architectural_smells'].items()}
 
     def detect_smells(self, directory_path):
@@ -113,128 +287,234 @@ class ArchitecturalSmellDetector:
         """
         Analyze all Python files in the given directory and its subdirectories.
 
+        The directory is walked serially, then the files are parsed in parallel
+        worker processes and their results are merged on the main process, in
+        the order of the walk.
+
         Args:
             directory_path (str): The path to the directory to be analyzed.
         """
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    self.analyze_file(file_path)
+        max_file_size = self.thresholds.get('MAX_FILE_SIZE', DEFAULT_MAX_FILE_SIZE)
+        # (file path, whether the file is to be parsed), in walk order
+        files = []
+
+        for entry in iter_python_files(directory_path):
+            file_path = entry.path
+            size = entry.stat().st_size
+            if size == 0:
+                # Empty modules (e.g. bare __init__.py) have nothing to parse
+                logger.debug(f"Empty file, registering without parsing: {file_path}")
+                files.append((file_path, False))
+                continue
+            if should_skip_file(file_path, entry.name, size, max_file_size):
+                continue
+            files.append((file_path, True))
+
+        results = iter(self._parse_files([file_path for file_path, parse in files if parse]))
+        for file_path, parse in files:
+            if parse:
+                self._merge_file_result(file_path, *next(results))
+            else:
+                self._register_module(file_path)
         
         # After analyzing all files, resolve external dependencies
         self.resolve_external_dependencies()
 
+    def _parse_files(self, file_paths):
+        """
+        Extract the facts of the given files, in worker processes when worthwhile.
+
+        Args:
+            file_paths (list): The paths of the Python files to parse.
+
+        Returns:
+            iterator: (ModuleFacts or None, Exception or None) tuples, in input order.
+        """
+        return parse_files(_extract_module_facts, 'architectural', file_paths, self.cache_dir, self.jobs,
+                           errors=Exception, min_files=self.PARALLEL_MIN_FILES,
+                           chunksize=self.PARALLEL_CHUNKSIZE)
+
     def analyze_file(self, file_path):
         """
         Analyze a single Python file for architectural information with improved
         intra-project dependency detection.
         """
-        try:
-            with open(file_path, 'r') as file:
-                tree = ast.parse(file.read())
-
-            # Get relative module path
-            module_name = os.path.relpath(file_path, os.path.dirname(os.path.dirname(file_path)))
-            module_name = module_name.replace(os.path.sep, '.')[:-3]  # Remove .py extension
-            self.module_dependencies.add_node(module_name)
-            self.file_paths[module_name] = file_path
-            
-            # Track local imports and their line numbers
-            local_imports = []
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        import_name = alias.name
-                        local_imports.append((import_name, node.lineno))
-                        self.module_dependencies.add_edge(module_name, import_name)
-                
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        # Handle relative imports
-                        if node.level > 0:  # This is a relative import
-                            current_package = module_name.split('.')
-                            # Go up by node.level
-                            parent_package = '.'.join(current_package[:-node.level])
-                            if parent_package:
-                                import_name = f"{parent_package}.{node.module}"
-                            else:
-                                import_name = node.module
-                        else:
-                            import_name = node.module
-                        
-                        local_imports.append((import_name, node.lineno))
-                        self.module_dependencies.add_edge(module_name, import_name)
-                        
-                        # Track imported names for more detailed dependency analysis
-                        for alias in node.names:
-                            if alias.name != '*':
-                                full_import = f"{import_name}.{alias.name}"
-                                self.module_functions[import_name].add(alias.name)
-                
-                elif isinstance(node, ast.FunctionDef):
-                    self.module_functions[module_name].add(node.name)
-                
-                elif isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Attribute):
-                        self.api_usage[module_name].append(node.func.attr)
-                        
-                        # Track function calls between modules
-                        if isinstance(node.func.value, ast.Name):
-                            # Check if this is a call to an imported module
-                            module_called = node.func.value.id
-                            if any(module_called == imp[0].split('.')[-1] for imp in local_imports):
-                                self.function_calls[module_name].add((module_called, node.func.attr))
-
-        except SyntaxError as e:
-            print(f"Parse error in file {file_path}: {str(e)}")
-        except Exception as e:
-            print(f"Error analyzing file {file_path}: {str(e)}")
+        self._merge_file_result(file_path, *next(iter(self._parse_files([file_path]))))
+
+    def _merge_file_result(self, file_path, facts, error):
+        """
+        Merge the facts extracted from a file, or report why they could not be extracted.
+
+        Args:
+            file_path (str): The path to the Python file.
+            facts (ModuleFacts): The information extracted from the file, or None on error.
+            error (Exception): The error raised while extracting the facts, if any.
+        """
+        if isinstance(error, SyntaxError):
+            print(f"Parse error in file {file_path}: {str(error)}")
+        elif error is not None:
+            print(f"Error analyzing file {file_path}: {str(error)}")
+        else:
+            try:
+                self._merge_module_facts(facts)
+            except Exception as e:
+                print(f"Error analyzing file {file_path}: {str(e)}")
+
+    def _merge_module_facts(self, facts):
+        """
+        Add the information extracted from a file to the dependency graph and the module maps.
+
+        Args:
+            facts (ModuleFacts): The information extracted from the file.
+        """
+        module_name = self._register_module(facts.file_path)
+        edges = []
+        # Functions are added in traversal order, between the imports they precede
+        added = 0
+
+        for (name, level, _, imported_names), offset in zip(facts.imports, facts.import_offsets):
+            for function_name in facts.functions[added:offset]:
+                self._add_function(module_name, function_name)
+            added = offset
+
+            # Handle relative imports
+            if level > 0:
+                current_package = module_name.split('.')
+                # Go up by level
+                parent_package = '.'.join(current_package[:-level])
+                import_name = f"{parent_package}.{name}" if parent_package else name
+            else:
+                import_name = name
+            # Module names are interned, like the names of the analyzed modules
+            import_name = sys.intern(import_name)
+            edges.append((module_name, import_name))
+
+            # Track imported names for more detailed dependency analysis
+            for imported_name in imported_names:
+                self._add_function(import_name, imported_name)
+
+        # Added at once, in import order
+        self.module_dependencies.add_edges_from(edges)
+
+        for function_name in facts.functions[added:]:
+            self._add_function(module_name, function_name)
+        if facts.api_calls:
+            self.api_usage[module_name].update(facts.api_calls)
+        if facts.module_calls:
+            self.function_calls[module_name].update(facts.module_calls)
+
+    def _add_function(self, module_name, function_name):
+        """
+        Record a function of a module, keeping the function index up to date.
+
+        Args:
+            module_name (str): The name of the module.
+            function_name (str): The name of the function.
+        """
+        functions = self.module_functions[module_name]
+        if function_name not in functions:
+            functions.add(function_name)
+            self.function_to_modules[function_name].append(module_name)
+            if not function_name.startswith(_GOD_OBJECT_EXCLUDED_PREFIXES):
+                self._public_function_counts[module_name] += 1
+
+    def _register_module(self, file_path):
+        """
+        Register a module node and its file path.
+
+        Args:
+            file_path (str): The path to the Python file.
+
+        Returns:
+            str: The module name derived from the file path.
+        """
+        # Get relative module path
+        module_name = os.path.relpath(file_path, os.path.dirname(os.path.dirname(file_path)))
+        module_name = module_name.replace(os.path.sep, '.')[:-3]  # Remove .py extension
+        # Module names key the graph and every per-module map: interned names
+        # compare by identity in those lookups
+        module_name = sys.intern(module_name)
+        self.module_dependencies.add_node(module_name)
+        self.file_paths[module_name] = file_path
+        self._degrees = None
+        return module_name
 
     def resolve_external_dependencies(self):
         """
         Resolve external dependencies while preserving intra-project dependencies.
+
+        The project part of the graph is rebuilt in a single pass over the edges
+        instead of removing the external edges and nodes one by one. A dependency
+        is a stdlib one when its top-level package is a stdlib module, e.g. ``os``
+        for ``os.path``; a mere name prefix such as ``ast`` for ``astroid`` is not
+        enough.
         """
+        # Every file may have been skipped, e.g. generated or oversized ones
+        if not self.file_paths:
+            return
+
         # Get all project modules
         project_root = os.path.dirname(os.path.dirname(next(iter(self.file_paths.values()))))
-        all_modules = set(self.module_dependencies.nodes())
-        standard_lib_modules = set(sys.stdlib_module_names)
+        # Only the modules registered from the analyzed files, import targets are
+        # nodes of the graph as well
+        all_modules = self.file_paths.keys()
+        # Whether each dependency is a project module, computed once per dependency
+        project_cache = {}
+        project_edges = []
         
-        for module in list(self.module_dependencies.nodes()):
-            for dependency in list(self.module_dependencies.successors(module)):
+        for module, dependency in self.module_dependencies.edges():
+            is_project_module = project_cache.get(dependency)
+            if is_project_module is None:
                 # Check if it's a project module by looking for the file
                 possible_paths = [
                     os.path.join(project_root, *dependency.split('.')) + '.py',
                     os.path.join(project_root, dependency.split('.')[0], '__init__.py')
                 ]
                 
-                is_project_module = (
+                is_project_module = project_cache[dependency] = (
                     dependency in all_modules or
                     any(os.path.exists(path) for path in possible_paths)
                 )
-                
-                # Keep project dependencies, handle external ones
-                if not is_project_module:
-                    is_stdlib = any(dependency.startswith(std_lib) for std_lib in standard_lib_modules)
-                    
-                    try:
-                        spec = importlib.util.find_spec(dependency.split('.')[0])
-                        is_third_party = spec is not None and not is_stdlib
-                    except (ModuleNotFoundError, ValueError):
-                        is_third_party = False
-                    
-                    self.module_dependencies.remove_edge(module, dependency)
-                    
-                    if is_stdlib:
-                        self.external_dependencies[module].add(('stdlib', dependency))
-                    elif is_third_party:
-                        self.external_dependencies[module].add(('third_party', dependency))
-                    
-                    # Remove isolated external nodes
-                    if not self.module_dependencies.in_edges(dependency) and \
-                       not self.module_dependencies.out_edges(dependency):
-                        self.module_dependencies.remove_node(dependency)
+            
+            # Keep project dependencies, handle external ones
+            if is_project_module:
+                project_edges.append((module, dependency))
+                continue
+            
+            top_level = dependency.partition('.')[0]
+            is_stdlib = top_level in sys.stdlib_module_names
+            is_third_party = not is_stdlib and _is_installed_package(top_level)
+            
+            if is_stdlib:
+                self.external_dependencies[module].add(('stdlib', dependency))
+            elif is_third_party:
+                self.external_dependencies[module].add(('third_party', dependency))
+
+        if len(project_edges) < self.module_dependencies.number_of_edges():
+            # External modules are only ever import targets: once their edges are
+            # dropped they are isolated, and are left out as well
+            project_graph = nx.DiGraph()
+            project_graph.add_nodes_from(node for node in self.module_dependencies
+                                         if project_cache.get(node, True))
+            project_graph.add_edges_from(project_edges)
+            self.module_dependencies = project_graph
+
+        self._degrees = None
+
+    def _dependency_degrees(self):
+        """
+        Get the in- and out-degree of every module in the dependency graph.
+
+        The degrees are computed once per analysis and shared by the hub-like,
+        orphan module and unstable dependency detectors.
+
+        Returns:
+            tuple: (in-degree dict, out-degree dict), keyed by module name.
+        """
+        if self._degrees is None:
+            self._degrees = (dict(self.module_dependencies.in_degree()),
+                             dict(self.module_dependencies.out_degree()))
+        return self._degrees
 
     def add_smell(self, name, description, file_path, module_class, line_number=None, severity='medium'):
         """
@@ -267,66 +547,65 @@ class ArchitecturalSmellDetector:
             
         threshold = self.thresholds.get('HUB_LIKE_DEPENDENCY_THRESHOLD', 0.5)
         min_connections = self.thresholds.get('MIN_HUB_CONNECTIONS', 5)
+        in_degrees, out_degrees = self._dependency_degrees()
         
-        for node in self.module_dependencies.nodes():
+        for node, in_degree in in_degrees.items():
             # Count both internal and external dependencies
-            in_degree = self.module_dependencies.in_degree(node)
-            out_degree = self.module_dependencies.out_degree(node)
-            external_deps = len(self.external_dependencies[node])
+            out_degree = out_degrees[node]
+            external_deps = len(self.external_dependencies.get(node, ()))
             total_connections = in_degree + out_degree + external_deps
             
-            # Calculate fan-in and fan-out ratios
-            fan_in_ratio = in_degree / total_modules if total_modules > 0 else 0
-            fan_out_ratio = (out_degree + external_deps) / total_modules if total_modules > 0 else 0
-            
-            # Check for hub-like characteristics
-            is_hub = (total_connections >= min_connections and 
-                     (total_connections / total_modules) > threshold)
+            # Check for hub-like characteristics, most modules stop here
+            if (total_connections < min_connections or 
+                total_connections / total_modules <= threshold):
+                continue
             
             # Additional checks to reduce false positives
-            if is_hub:
-                # Exclude common infrastructure modules
-                if any(pattern in node.lower() for pattern in ['util', 'common', 'base', 'core']):
-                    continue
-                    
-                # Check if the module has balanced dependencies
-                is_balanced = 0.2 <= fan_in_ratio / (fan_out_ratio + 0.0001) <= 5
+            # Exclude common infrastructure modules
+            if any(pattern in node.lower() for pattern in _HUB_EXCLUDED_PATTERNS):
+                continue
+            
+            # Calculate fan-in and fan-out ratios
+            fan_in_ratio = in_degree / total_modules
+            fan_out_ratio = (out_degree + external_deps) / total_modules
                 
-                if not is_balanced:
-                    self.add_smell(
-                        "Hub-like Dependency",
-                        f"Module '{node}' is a potential hub with {total_connections} connections "
-                        f"(in: {in_degree}, out: {out_degree}, external: {external_deps})",
-                        self.file_paths.get(node, "Unknown"),
-                        node,
-                        severity='high' if total_connections > min_connections * 2 else 'medium'
-                    )
+            # Check if the module has balanced dependencies
+            is_balanced = 0.2 <= fan_in_ratio / (fan_out_ratio + 0.0001) <= 5
+            
+            if not is_balanced:
+                self.add_smell(
+                    "Hub-like Dependency",
+                    f"Module '{node}' is a potential hub with {total_connections} connections "
+                    f"(in: {in_degree}, out: {out_degree}, external: {external_deps})",
+                    self.file_paths.get(node, "Unknown"),
+                    node,
+                    severity='high' if total_connections > min_connections * 2 else 'medium'
+                )
 
     def detect_scattered_functionality(self):
         """
         Detect scattered functionality in the project.
         """
-        function_modules = defaultdict(list)
         min_function_length = 3  # Ignore very short function names
         excluded_names = {'main', 'init', 'setup', 'test'}  # Common function names to exclude
-        
-        for module, functions in self.module_functions.items():
-            for func in functions:
-                # Skip common/utility functions and short names
-                if (len(func) >= min_function_length and 
-                    func.lower() not in excluded_names and 
-                    not func.startswith('_')):  # Skip private functions
-                    function_modules[func].append(module)
-        
         min_occurrences = self.thresholds.get('MIN_SCATTERED_OCCURRENCES', 3)
-        for func, modules in function_modules.items():
-            if len(modules) >= min_occurrences:  # Increase minimum occurrences threshold
-                self.add_smell(
-                    "Scattered Functionality",
-                    f"Function '{func}' appears in {len(modules)} modules: {', '.join(modules)}",
-                    self.file_paths.get(modules[0], "Unknown"),
-                    modules[0]
-                )
+        # Modules are listed in the order they were first given a function
+        module_order = {module: i for i, module in enumerate(self.module_functions)}
+        
+        for func, modules in self.function_to_modules.items():
+            # Skip common/utility functions, short names and private functions
+            if (len(modules) < min_occurrences or
+                len(func) < min_function_length or
+                func.lower() in excluded_names or
+                func.startswith('_')):
+                continue
+            modules = sorted(modules, key=module_order.__getitem__)
+            self.add_smell(
+                "Scattered Functionality",
+                f"Function '{func}' appears in {len(modules)} modules: {', '.join(modules)}",
+                self.file_paths.get(modules[0], "Unknown"),
+                modules[0]
+            )
 
     def detect_redundant_abstractions(self):
         """
@@ -339,13 +618,13 @@ class ArchitecturalSmellDetector:
             # Only consider modules with sufficient functions
             if len(functions) >= min_functions:
                 # Filter out private functions and common utility functions
-                public_functions = {f for f in functions 
-                                 if not f.startswith('_') 
-                                 and len(f) > 3 
-                                 and f.lower() not in {'main', 'init', 'setup', 'test'}}
+                signature = frozenset(f for f in functions 
+                                      if not f.startswith('_') 
+                                      and len(f) > 3 
+                                      and f.lower() not in {'main', 'init', 'setup', 'test'})
                 
-                if public_functions:  # Only proceed if there are public functions
-                    signature = frozenset(public_functions)
+                # Smaller signatures, including empty ones, are never reported
+                if len(signature) >= min_functions:
                     similar_modules[signature].append(module)
         
         similarity_threshold = self.thresholds.get('REDUNDANT_SIMILARITY_THRESHOLD', 0.8)
@@ -371,19 +650,15 @@ class ArchitecturalSmellDetector:
         Detect god objects in the project.
         """
         min_functions = self.thresholds.get('MIN_GOD_OBJECT_FUNCTIONS', 5)
-        excluded_patterns = {'test_', 'setup_', 'config_'}  # Common prefixes to exclude
         
-        for module, functions in self.module_functions.items():
-            # Filter out private methods and common test/setup functions
-            public_functions = {f for f in functions 
-                              if not f.startswith('_') and 
-                              not any(f.startswith(pattern) for pattern in excluded_patterns)}
-            
-            if (len(public_functions) >= min_functions and 
-                len(public_functions) > self.thresholds['GOD_OBJECT_FUNCTIONS']):
+        # The public functions are counted as they are added to the modules
+        for module, public_functions in self._public_function_counts.items():
+            # GOD_OBJECT_FUNCTIONS is only required once a module reaches the minimum
+            if (public_functions >= min_functions and
+                public_functions > self.thresholds['GOD_OBJECT_FUNCTIONS']):
                 self.add_smell(
                     "God Object",
-                    f"Module '{module}' has too many public functions ({len(public_functions)})", 
+                    f"Module '{module}' has too many public functions ({public_functions})", 
                     self.file_paths.get(module, "Unknown"),
                     module
                 )
@@ -395,19 +670,15 @@ class ArchitecturalSmellDetector:
         min_calls = self.thresholds.get('MIN_API_CALLS', 10)  # Minimum calls to consider
         repetition_threshold = self.thresholds.get('API_REPETITION_THRESHOLD', 0.4)
         
-        for module, api_calls in self.api_usage.items():
-            if len(api_calls) >= min_calls:
-                # Count frequency of each API call
-                call_frequency = {}
-                for call in api_calls:
-                    call_frequency[call] = call_frequency.get(call, 0) + 1
-                
+        for module, call_frequency in self.api_usage.items():
+            total_calls = call_frequency.total()
+            if total_calls >= min_calls:
                 # Check for highly repetitive calls
                 repetitive_calls = {call: count for call, count in call_frequency.items() 
                                   if count >= 3}  # Ignore calls repeated less than 3 times
                 
                 if (repetitive_calls and 
-                    sum(repetitive_calls.values()) / len(api_calls) > repetition_threshold):
+                    sum(repetitive_calls.values()) / total_calls > repetition_threshold):
                     self.add_smell(
                         "Potential Improper API Usage",
                         f"Module '{module}' has repetitive API calls: " +
@@ -426,10 +697,11 @@ class ArchitecturalSmellDetector:
         if len(self.module_dependencies.nodes()) < min_project_size:
             return
             
-        for node in self.module_dependencies.nodes():
+        in_degrees, out_degrees = self._dependency_degrees()
+        for node, in_degree in in_degrees.items():
             module_name = node.split('.')[-1]
             # Fix: Check if any excluded module name is in the full node path
-            if (self.module_dependencies.in_degree(node) + self.module_dependencies.out_degree(node) == 0 and
+            if (in_degree + out_degrees[node] == 0 and
                 module_name not in excluded_modules and
                 not any(excluded in node.lower() for excluded in excluded_modules)):
                 self.add_smell(
@@ -448,27 +720,32 @@ class ArchitecturalSmellDetector:
         max_cycle_size = self.thresholds.get('MAX_CYCLE_SIZE', 5)
         excluded_modules = {'__init__', 'utils', 'common', 'base', 'core'}
         
-        # Find all simple cycles
-        cycles = list(nx.simple_cycles(self.module_dependencies))
-        
+        # Cycles through excluded modules are never reported, so those modules are
+        # left out of the search altogether
+        graph = self.module_dependencies
+        graph = graph.subgraph(node for node in graph
+                               if not any(excluded in node.lower() for excluded in excluded_modules))
+        if nx.is_directed_acyclic_graph(graph):
+            return
+
         # Group cycles by their shared nodes to identify related cycles
         cycle_groups = defaultdict(list)
-        
-        for cycle in cycles:
-            if min_cycle_size <= len(cycle) <= max_cycle_size:
-                # Skip cycles containing excluded modules
-                if any(any(excluded in node.lower() for excluded in excluded_modules) 
-                      for node in cycle):
+
+        # Every cycle lies within a strongly connected component: each component
+        # is searched on its own
+        for component in nx.strongly_connected_components(graph):
+            if len(component) < min_cycle_size:
+                continue
+            component_graph = graph.subgraph(component)
+
+            for cycle in nx.simple_cycles(component_graph, length_bound=max_cycle_size):
+                if len(cycle) < min_cycle_size:
                     continue
                 
-                # Calculate cycle metrics
-                cycle_strength = 0
-                for i in range(len(cycle)):
-                    node1 = cycle[i]
-                    node2 = cycle[(i + 1) % len(cycle)]
-                    # Count mutual dependencies
-                    cycle_strength += sum(1 for _ in nx.all_simple_paths(
-                        self.module_dependencies, node1, node2))
+                # Count mutual dependencies, i.e. the cycle edges whose reverse
+                # edge also exists
+                cycle_strength = sum(component_graph.has_edge(cycle[(i + 1) % len(cycle)], cycle[i])
+                                     for i in range(len(cycle)))
                 
                 # Group related cycles
                 cycle_key = frozenset(cycle)
@@ -498,18 +775,23 @@ class ArchitecturalSmellDetector:
         """
         min_dependencies = self.thresholds.get('MIN_DEPENDENCIES', 5)  # Minimum dependencies to consider
         excluded_patterns = {'test_', 'setup_', '__init__'}  # Patterns to exclude
+        # UNSTABLE_DEPENDENCY_THRESHOLD is only required once a module reaches
+        # MIN_DEPENDENCIES, it is then read once
+        threshold = None
+        in_degrees, out_degrees = self._dependency_degrees()
         
-        for node in self.module_dependencies.nodes():
+        for node, in_degree in in_degrees.items():
             if any(pattern in node for pattern in excluded_patterns):
                 continue
                 
-            in_degree = self.module_dependencies.in_degree(node)
-            out_degree = self.module_dependencies.out_degree(node)
+            out_degree = out_degrees[node]
             total_dependencies = in_degree + out_degree
             
             if total_dependencies >= min_dependencies:
                 instability = out_degree / total_dependencies
-                if instability > self.thresholds['UNSTABLE_DEPENDENCY_THRESHOLD']:
+                if threshold is None:
+                    threshold = self.thresholds['UNSTABLE_DEPENDENCY_THRESHOLD']
+                if instability > threshold:
                     self.add_smell(
                         "Unstable Dependency",
                         f"Module '{node}' has high instability ({instability:.2f}) " +
@@ -527,9 +809,9 @@ class ArchitecturalSmellDetector:
         if not self.architectural_smells:
             print("No architectural smells detected.")
         else:
-            print("Detected Architectural Smells:")
-            for smell in self.architectural_smells:
-                print(f"- {smell}")
+            # Written at once rather than with a print call per smell
+            print("\n".join(["Detected Architectural Smells:"] +
+                            [f"- {smell}" for smell in self.architectural_smells]))
 
 def analyze_architecture(directory_path, config_path):
     """
@@ -539,7 +821,7 @@ def analyze_architecture(directory_path, config_path):
         directory_path (str): The path to the directory containing the Python project to analyze.
         config_path (str): The path to the configuration file containing smell detection thresholds.
     """
-    detector = ArchitecturalSmellDetector(config_path)
+    detector = ArchitecturalSmellDetector(ArchitecturalSmellDetector.load_thresholds(config_path))
     detector.detect_smells(directory_path)
     detector.print_report()
 
@@ -1,8 +1,37 @@
+import os
 import yaml
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# The libyaml-based loader is much faster, when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+@lru_cache(maxsize=32)
+def _parse_config(config_path, mtime_ns):
+    """Parse a YAML configuration file, memoized while its modification time is unchanged."""
+    with open(config_path, 'r') as file:
+        return yaml.load(file, Loader=_SafeLoader)
+
+def read_config(config_path):
+    """
+    Read a YAML configuration file.
+
+    The parsed content is shared between the callers reading the same unchanged
+    file, so it must not be modified.
+
+    Args:
+        config_path (str): The path to the YAML configuration file.
+
+    Returns:
+        dict: The parsed configuration.
+    """
+    return _parse_config(config_path, os.stat(config_path).st_mtime_ns)
+
 class ConfigHandler:
     """
     A class to handle configuration loading and management for code quality analysis.
@@ -24,8 +53,7 @@ class ConfigHandler:
         Load threshold values from the YAML configuration file.
         """
         try:
-            with open(self.config_path, 'r') as file:
-                config = yaml.safe_load(file)
+            config = read_config(self.config_path)
                 
             logger.info(f"Loading configuration from: {self.config_path}")
             
@@ -0,0 +1,78 @@
+import os
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from .analysis_cache import AnalysisCache
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+# Below this many files, parsing in-process is faster than starting a pool
+PARALLEL_MIN_FILES = 32
+PARALLEL_CHUNKSIZE = 16
+
+@lru_cache(maxsize=512)
+def _cached_file_facts(extract, namespace, file_path, mtime_ns, size, cache_dir):
+    """In-process memo of an extraction function, keyed by the identity of the file on disk."""
+    cache = AnalysisCache(cache_dir, namespace=namespace) if cache_dir else None
+    return extract(file_path, cache)
+
+def load_file_facts(extract, namespace, file_path, cache_dir=None):
+    """
+    Get the facts of a file, reusing those extracted earlier in this process if
+    the file has not changed since.
+
+    Args:
+        extract (callable): The module-level function extracting the facts of a
+            file, called with the file path and an AnalysisCache or None.
+        namespace (str): The namespace of the detector's entries in the on-disk cache.
+        file_path (str): The path to the Python file to be analyzed.
+        cache_dir (str, optional): The directory of the on-disk facts cache.
+
+    Returns:
+        object: The facts returned by ``extract``.
+
+    Raises:
+        Exception: Whatever ``extract`` raises for the file.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        # Let the extraction report the error
+        cache = AnalysisCache(cache_dir, namespace=namespace) if cache_dir else None
+        return extract(file_path, cache)
+    return _cached_file_facts(extract, namespace, file_path, stat.st_mtime_ns, stat.st_size, cache_dir)
+
+def _file_facts_worker(extract, namespace, errors, cache_dir, file_path):
+    """Process pool entry point: load the facts of a file, returning the expected errors."""
+    try:
+        return load_file_facts(extract, namespace, file_path, cache_dir), None
+    except errors as e:
+        return None, e
+
+def parse_files(extract, namespace, file_paths, cache_dir=None, jobs=1, errors=Exception,
+                min_files=PARALLEL_MIN_FILES, chunksize=PARALLEL_CHUNKSIZE):
+    """
+    Load the facts of the given files, in worker processes when worthwhile.
+
+    Args:
+        extract (callable): The module-level extraction function (see load_file_facts).
+        namespace (str): The namespace of the detector's entries in the on-disk cache.
+        file_paths (list): The paths of the Python files to parse.
+        cache_dir (str, optional): The directory of the on-disk facts cache.
+        jobs (int, optional): The number of worker processes.
+        errors (type or tuple, optional): The exceptions returned instead of raised.
+        min_files (int, optional): Below this many files, the files are parsed in-process.
+        chunksize (int, optional): The number of files sent to a worker at a time.
+
+    Returns:
+        iterator: (facts or None, exception or None) tuples, in input order.
+    """
+    worker = partial(_file_facts_worker, extract, namespace, errors, cache_dir)
+    if jobs <= 1 or len(file_paths) < min_files:
+        return map(worker, file_paths)
+
+    logger.debug(f"Parsing {len(file_paths)} files with {jobs} worker processes")
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Materialize before the pool shuts down
+        return list(executor.map(worker, file_paths, chunksize=chunksize))
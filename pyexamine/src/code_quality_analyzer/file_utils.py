@@ -0,0 +1,75 @@
+import os
+import logging
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_FILE_SIZE = 2 * 1024 * 1024  # 2 MiB
+GENERATED_FILE_SUFFIXES = ('_pb2.py', '_pb2_grpc.py')
+# Version control, tool and virtual environment directories, which hold no project sources
+SKIPPED_DIRECTORIES = frozenset({
+    '__pycache__', '.git', '.hg', '.svn', '.tox', '.nox', '.venv',
+    '.mypy_cache', '.pytest_cache', 'node_modules',
+})
+
+def should_skip_file(file_path, file_name, size, max_file_size=DEFAULT_MAX_FILE_SIZE):
+    """
+    Decide whether a Python file can be skipped without parsing it.
+
+    Generated protobuf modules and files larger than ``max_file_size`` are skipped
+    with a warning, since they cannot meaningfully trigger smells.
+
+    Args:
+        file_path (str): The path to the file
+        file_name (str): The base name of the file
+        size (int): The size of the file in bytes
+        max_file_size (int, optional): Files larger than this many bytes are skipped
+
+    Returns:
+        bool: True if the file should not be parsed, False otherwise.
+    """
+    if file_name.endswith(GENERATED_FILE_SUFFIXES):
+        logger.warning(f"Skipping generated file: {file_path}")
+        return True
+    if max_file_size and size > max_file_size:
+        logger.warning(f"Skipping {file_path}: file size {size} bytes exceeds {max_file_size} bytes")
+        return True
+    return False
+
+def iter_python_files(directory_path):
+    """
+    Yield the Python files found under a directory.
+
+    The tree is traversed with ``os.scandir`` so that file types come from the
+    directory entries without extra ``stat`` calls. Files are yielded in the same
+    order as ``os.walk`` (top-down, a directory's files before its subdirectories).
+    Symlinked directories are not followed and directories named in
+    SKIPPED_DIRECTORIES are not entered.
+
+    Args:
+        directory_path (str): The root directory to traverse
+
+    Yields:
+        os.DirEntry: An entry for each ``.py`` file.
+    """
+    stack = [directory_path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                entries = list(entries)
+        except OSError as e:
+            logger.warning(f"Cannot read directory: {str(e)}")
+            continue
+
+        subdirectories = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if entry.name not in SKIPPED_DIRECTORIES and not entry.is_symlink():
+                    subdirectories.append(entry.path)
+            elif entry.name.endswith('.py'):
+                yield entry
+        stack.extend(reversed(subdirectories))
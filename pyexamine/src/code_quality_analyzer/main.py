@@ -2,9 +2,14 @@ import os
 import argparse
 import csv
 import logging
+import queue
+import shutil
+import tempfile
+import threading
 from .code_smell_detector import CodeSmellDetector
 from .architectural_smell_detector import ArchitecturalSmellDetector
 from .structural_smell_detector import StructuralSmellDetector
+from .analysis_cache import DEFAULT_CACHE_DIR
 from .config_handler import ConfigHandler
 from .exceptions import CodeAnalysisError
 
@@ -19,6 +24,180 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+REPORT_QUEUE_SIZE = 1024
+# Per-kind report sections are kept in memory up to this size, then spill to disk
+REPORT_SPOOL_SIZE = 1024 * 1024
+CSV_FIELDNAMES = ['Type', 'Name', 'Description', 'File', 'Module/Class', 'Line Number', 'Severity']
+
+# Text report section headers, in the layout of generate_report
+_SECTION_HEADERS = {
+    'Structural': "Structural Smells:\n-------------------\n",
+    'Code': "Code Smells:\n------------\n",
+    'Architectural': "\nArchitectural Smells:\n---------------------\n",
+}
+
+def _section_header(kind):
+    """Return the header of a smell section of the text report."""
+    return _SECTION_HEADERS[kind]
+
+def _no_smells(kind):
+    """Return the placeholder written in place of an empty smell section."""
+    return f"No {kind.lower()} smells detected.\n\n"
+
+def _format_smell(kind, smell):
+    """Format a single smell as it appears in the text report."""
+    text = f"- {smell.name}: {smell.description}\n"
+    if kind == 'Structural':
+        if smell.line_number:
+            text += f"  Line: {smell.line_number}\n"
+        text += f"  File: {smell.file_path}\n"
+        text += f"  Severity: {smell.severity}\n\n"
+    return text
+
+def _csv_row(kind, smell):
+    """Build the CSV report row for a single smell."""
+    return {
+        'Type': kind,
+        'Name': smell.name,
+        'Description': smell.description,
+        'File': smell.file_path,
+        'Module/Class': smell.module_class,
+        'Line Number': smell.line_number,
+        'Severity': smell.severity
+    }
+
+class SmellStream:
+    """
+    Append-only sink that forwards every appended smell to a ReportWriter.
+
+    Assigning a stream to a detector's smell list (e.g. ``detector.architectural_smells``)
+    makes the detector feed the report directly instead of accumulating smells in memory.
+    The smells are not kept, so a stream only supports ``append``, ``extend`` and ``len``.
+    """
+
+    def __init__(self, writer, kind):
+        self.writer = writer
+        self.kind = kind
+        self.count = 0
+
+    def append(self, smell):
+        self.writer.put(self.kind, smell)
+        self.count += 1
+
+    def extend(self, smells):
+        for smell in smells:
+            self.append(smell)
+
+    def __len__(self):
+        return self.count
+
+class ReportWriter:
+    """
+    Write the text and CSV reports from a background thread while analysis is running.
+
+    Detected smells are passed as ``(kind, smell)`` tuples through a bounded queue.
+    The writer formats them into a spooled temporary file per kind, which spills to
+    disk past REPORT_SPOOL_SIZE, so memory usage stays bounded regardless of the
+    number of smells. On close the sections are assembled in KINDS order, whatever
+    order the kinds arrived in, so the reports are the same as generate_report's.
+
+    Attributes:
+        output_txt (str): The path to the output text file
+        output_csv (str): The path to the output CSV file
+        counts (dict): Number of smells written per kind
+    """
+
+    KINDS = ('Structural', 'Code', 'Architectural')
+
+    def __init__(self, output_txt, output_csv, maxsize=REPORT_QUEUE_SIZE):
+        self.output_txt = output_txt
+        self.output_csv = output_csv
+        self.counts = {kind: 0 for kind in self.KINDS}
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, name="report-writer", daemon=True)
+        self._error = None
+
+    def start(self):
+        """Start the writer thread."""
+        self._thread.start()
+        return self
+
+    def stream(self, kind):
+        """Return an append-only sink that feeds smells of the given kind to the writer."""
+        return SmellStream(self, kind)
+
+    def put(self, kind, smell):
+        """Queue a smell for writing, blocking if the writer is behind."""
+        self._queue.put((kind, smell))
+
+    def close(self, raise_error=True):
+        """
+        Flush the remaining smells, write the reports and wait for the writer to finish.
+
+        Args:
+            raise_error (bool, optional): Re-raise an error of the writer thread. When
+                False, e.g. while another exception propagates, the error is only logged.
+        """
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            if raise_error:
+                raise self._error
+            return
+        print(f"Text report generated and saved to {self.output_txt}")
+        logger.info(f"CSV report generated and saved to {self.output_csv}")
+
+    def _run(self):
+        # Text and CSV spools of each kind, with the CSV writer of the latter
+        sections = {}
+        item = ()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    break
+                kind, smell = item
+                if kind not in sections:
+                    txt_spool = tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_SIZE, mode='w+')
+                    csv_spool = tempfile.SpooledTemporaryFile(max_size=REPORT_SPOOL_SIZE, mode='w+',
+                                                              newline='')
+                    sections[kind] = (txt_spool, csv_spool,
+                                      csv.DictWriter(csv_spool, fieldnames=CSV_FIELDNAMES))
+                txt_spool, _, csv_writer = sections[kind]
+                self.counts[kind] += 1
+                txt_spool.write(_format_smell(kind, smell))
+                csv_writer.writerow(_csv_row(kind, smell))
+
+            with open(self.output_txt, 'w') as txtfile, open(self.output_csv, 'w', newline='') as csvfile:
+                csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES).writeheader()
+                txtfile.write("Code Quality Analysis Report\n")
+                txtfile.write("============================\n\n")
+
+                for kind in self.KINDS:
+                    if kind not in sections:
+                        txtfile.write(_no_smells(kind))
+                        continue
+                    txt_spool, csv_spool, _ = sections[kind]
+                    txtfile.write(_section_header(kind))
+                    txt_spool.seek(0)
+                    shutil.copyfileobj(txt_spool, txtfile)
+                    csv_spool.seek(0)
+                    shutil.copyfileobj(csv_spool, csvfile)
+
+                txtfile.write("\nSummary:\n")
+                txtfile.write("--------\n")
+                txtfile.write(f"Total Architectural Smells: {self.counts['Architectural']}\n")
+        except Exception as e:
+            logger.error(f"Error writing report: {str(e)}", exc_info=True)
+            self._error = e
+            # Keep draining so producers never block on a full queue
+            while item is not None:
+                item = self._queue.get()
+        finally:
+            for txt_spool, csv_spool, _ in sections.values():
+                txt_spool.close()
+                csv_spool.close()
+
 def analyze_code_smells(directory_path, detector):
     """
     Analyze a directory for code smells using the provided detector.
@@ -99,7 +278,8 @@ def analyze_architectural_smells(directory_path, detector):
         detector (ArchitecturalSmellDetector): The detector instance to use
 
     Returns:
-        list: A list of detected architectural smells
+        list: A list of detected architectural smells, or the detector's SmellStream
+            when its smells are streamed to a report
     """
     errors = []
     try:
@@ -162,6 +342,7 @@ def analyze_project(debug=False, smell_type=None):
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
     parser.add_argument("--type", choices=['code', 'architectural', 'structural'], 
                        help="Type of smell to analyze (default: all)")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the analysis cache")
     args = parser.parse_args()
 
     if args.debug or debug:
@@ -182,28 +363,35 @@ def analyze_project(debug=False, smell_type=None):
     try:
         logger.info(f"Loading configuration from: {args.config}")
         config_handler = ConfigHandler(args.config)
-        
-        code_smells = []
-        architectural_smells = []
-        structural_smells = []
-
-        #if smell_type in [None, 'code']:
-            #print("Analyzing Code Smells...")
-            #code_detector = CodeSmellDetector(config_handler.get_thresholds('code_smells'))
-            #code_smells = analyze_code_smells(args.directory, code_detector)
-
-        if smell_type in [None, 'architectural']:
-            print("Analyzing Architectural Smells...")
-            arch_detector = ArchitecturalSmellDetector(config_handler.get_thresholds('architectural_smells'))
-            architectural_smells = analyze_architectural_smells(args.directory, arch_detector)
-
-        #if smell_type in [None, 'structural']:
-        #    print("Analyzing Structural Smells...")
-        #    struct_detector = StructuralSmellDetector(config_handler.get_thresholds('structural_smells'))
-        #    structural_smells = analyze_structural_smells(args.directory, struct_detector)
 
-        generate_report(code_smells, architectural_smells, structural_smells, 
-                       output_txt, output_csv)
+        # Smells are streamed to the report while the analysis is running
+        report_writer = ReportWriter(output_txt, output_csv).start()
+        try:
+            #if smell_type in [None, 'code']:
+                #print("Analyzing Code Smells...")
+                #code_detector = CodeSmellDetector(config_handler.get_thresholds('code_smells'))
+                #code_detector.code_smells = report_writer.stream('Code')
+                #analyze_code_smells(args.directory, code_detector)
+
+            if smell_type in [None, 'architectural']:
+                print("Analyzing Architectural Smells...")
+                arch_detector = ArchitecturalSmellDetector(config_handler.get_thresholds('architectural_smells'),
+                                                           cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR)
+                arch_detector.architectural_smells = report_writer.stream('Architectural')
+                analyze_architectural_smells(args.directory, arch_detector)
+
+            #if smell_type in [None, 'structural']:
+            #    print("Analyzing Structural Smells...")
+            #    struct_detector = StructuralSmellDetector(config_handler.get_thresholds('structural_smells'),
+            #                                              cache_dir=None if args.no_cache else DEFAULT_CACHE_DIR,
+            #                                              cache_results=True)
+            #    struct_detector.structural_smells = report_writer.stream('Structural')
+            #    analyze_structural_smells(args.directory, struct_detector)
+        except BaseException:
+            # A report writing error must not hide the analysis error
+            report_writer.close(raise_error=False)
+            raise
+        report_writer.close()
 
     except Exception as e:
         logger.error(f"Error during analysis: {str(e)}", exc_info=True)
@@ -254,17 +442,20 @@ def analyze_structural_smells(directory_path, detector):
 
     return detector.structural_smells
 
-def analyze_structural_smells_only(directory_path, config_path="code_quality_config.yaml", output=None):
+def analyze_structural_smells_only(directory_path, config_path="code_quality_config.yaml", output=None,
+                                   cache_dir=DEFAULT_CACHE_DIR):
     """
     Analyze only structural smells in a Python project.
 
     Args:
         directory_path (str): The path to the directory to analyze
         config_path (str): Path to the configuration file
+        cache_dir (str): Directory of the analysis cache, or None to disable it
     """
     try:
         config_handler = ConfigHandler(config_path)
-        struct_detector = StructuralSmellDetector(config_handler.get_thresholds('structural_smells'))
+        struct_detector = StructuralSmellDetector(config_handler.get_thresholds('structural_smells'),
+                                                  cache_dir=cache_dir, cache_results=True)
         
         print("Analyzing Structural Smells...")
         structural_smells = analyze_structural_smells(directory_path, struct_detector)
@@ -302,32 +493,25 @@ def generate_report(code_smells, architectural_smells, structural_smells,
     report += "============================\n\n"
 
     if structural_smells:
-        report += "Structural Smells:\n"
-        report += "-------------------\n"
+        report += _section_header('Structural')
         for smell in structural_smells:
-            report += f"- {smell.name}: {smell.description}\n"
-            if smell.line_number:
-                report += f"  Line: {smell.line_number}\n"
-            report += f"  File: {smell.file_path}\n"
-            report += f"  Severity: {smell.severity}\n\n"
+            report += _format_smell('Structural', smell)
     else:
-        report += "No structural smells detected.\n\n"
+        report += _no_smells('Structural')
 
     if code_smells:
-        report += "Code Smells:\n"
-        report += "------------\n"
+        report += _section_header('Code')
         for smell in code_smells:
-            report += f"- {smell.name}: {smell.description}\n"
+            report += _format_smell('Code', smell)
     else:
-        report += "No code smells detected.\n\n"
+        report += _no_smells('Code')
     
     if architectural_smells:
-        report += "\nArchitectural Smells:\n"
-        report += "---------------------\n"
+        report += _section_header('Architectural')
         for smell in architectural_smells:
-            report += f"- {smell.name}: {smell.description}\n"
+            report += _format_smell('Architectural', smell)
     else:
-        report += "No architectural smells detected.\n\n"
+        report += _no_smells('Architectural')
 
     # Print summary
     report += "\nSummary:\n"
@@ -361,45 +545,20 @@ def generate_csv_report(code_smells, architectural_smells, structural_smells, cs
         csv_file (str): The path to the output CSV file
     """
     with open(csv_file, 'w', newline='') as csvfile:
-        fieldnames = ['Type', 'Name', 'Description', 'File', 'Module/Class', 'Line Number', 'Severity']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
         writer.writeheader()
 
         # Write structural smells
         for smell in structural_smells:
-            writer.writerow({
-                'Type': 'Structural',
-                'Name': smell.name,
-                'Description': smell.description,
-                'File': smell.file_path,
-                'Module/Class': smell.module_class,
-                'Line Number': smell.line_number,
-                'Severity': smell.severity
-            })
+            writer.writerow(_csv_row('Structural', smell))
 
         # Write code smells
         for smell in code_smells:
-            writer.writerow({
-                'Type': 'Code',
-                'Name': smell.name,
-                'Description': smell.description,
-                'File': smell.file_path,
-                'Module/Class': smell.module_class,
-                'Line Number': smell.line_number,
-                'Severity': smell.severity
-            })
+            writer.writerow(_csv_row('Code', smell))
 
         # Write architectural smells
         for smell in architectural_smells:
-            writer.writerow({
-                'Type': 'Architectural',
-                'Name': smell.name,
-                'Description': smell.description,
-                'File': smell.file_path,
-                'Module/Class': smell.module_class,
-                'Line Number': smell.line_number,
-                'Severity': smell.severity
-            })
+            writer.writerow(_csv_row('Architectural', smell))
 
     logger.info(f"CSV report generated and saved to {csv_file}")
 
@@ -425,22 +584,27 @@ def analyze_code_smells_only(directory_path, config_path="code_quality_config.ya
         logger.error(f"Error analyzing code smells: {str(e)}", exc_info=True)
         raise
 
-def analyze_architectural_smells_only(directory_path, config_path="code_quality_config.yaml"):
+def analyze_architectural_smells_only(directory_path, config_path="code_quality_config.yaml", output=None,
+                                      cache_dir=DEFAULT_CACHE_DIR):
     """
     Analyze only architectural smells in a Python project.
     
     Args:
         directory_path (str): The path to the directory to analyze
         config_path (str): Path to the configuration file
+        output (str): Path to the output file, the default report name is used when None
+        cache_dir (str): Directory of the analysis cache, or None to disable it
     """
     try:
         config_handler = ConfigHandler(config_path)
-        arch_detector = ArchitecturalSmellDetector(config_handler.get_thresholds('architectural_smells'))
+        arch_detector = ArchitecturalSmellDetector(config_handler.get_thresholds('architectural_smells'),
+                                                   cache_dir=cache_dir)
         
         print("Analyzing Architectural Smells...")
         architectural_smells = analyze_architectural_smells(directory_path, arch_detector)
         
-        generate_report([], architectural_smells, [], "architectural_smells_report.txt")
+        txt_file = f"{os.path.splitext(output)[0]}.txt" if output else "architectural_smells_report.txt"
+        generate_report([], architectural_smells, [], txt_file)
         return architectural_smells
         
     except Exception as e:
@@ -455,6 +619,7 @@ if __name__ == "__main__":
     parser.add_argument("--type", choices=['code', 'architectural', 'structural'], 
                        help="Type of smell to analyze (default: all)")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the analysis cache")
     
     args = parser.parse_args()
     
@@ -468,11 +633,13 @@ if __name__ == "__main__":
         output_csv = "code_quality_report.csv"
     
     if args.type == 'structural':
-        analyze_structural_smells_only(args.directory, args.config, args.output)
+        analyze_structural_smells_only(args.directory, args.config, args.output,
+                                       None if args.no_cache else DEFAULT_CACHE_DIR)
     elif args.type == 'code':
         analyze_code_smells_only(args.directory, args.config, args.output)
     elif args.type == 'architectural':
-        analyze_architectural_smells_only(args.directory, args.config, args.output)
+        analyze_architectural_smells_only(args.directory, args.config, args.output,
+                                          None if args.no_cache else DEFAULT_CACHE_DIR)
     else:
         analyze_project(args.debug, args.type)
 
@@ -1,15 +1,52 @@
 import os
+import re
 import ast
+import weakref
 import networkx as nx
-from collections import defaultdict
-from dataclasses import dataclass
-import yaml
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import NamedTuple
 import logging
+from .analysis_cache import DEFAULT_CACHE_DIR, AnalysisCache
+from .config_handler import read_config
 from .exceptions import CodeAnalysisError
+from .fact_loader import PARALLEL_CHUNKSIZE, PARALLEL_MIN_FILES, load_file_facts, parse_files
+from .file_utils import DEFAULT_MAX_FILE_SIZE, iter_python_files, should_skip_file
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Base classes left out of the inheritance tree (DIT)
+_FRAMEWORK_BASES = frozenset({'object', 'Exception', 'dict', 'list', 'set', 'tuple', 'str', 'int', 'float'})
+_SKIPPED_BASE_RE = re.compile(r'Mixin|Interface|ABC|Abstract')
+
+# Standard library calls left out of the response set (RFC)
+_RFC_STDLIB_CALL_RE = re.compile(r'(?:os|sys|datetime|collections|json)\.')
+
+# Calls and dependencies left out of the coupling metrics (MPC, CBO, fan-out)
+_MPC_STDLIB_PREFIXES = ('os.', 'sys.', 'datetime.', 'collections.', 'json.', 'logging.')
+_MPC_FRAMEWORK_PREFIXES = ('get_', 'set_', 'is_', 'has_', '__')
+_MPC_SKIPPED_PREFIXES = _MPC_STDLIB_PREFIXES + _MPC_FRAMEWORK_PREFIXES
+_CBO_EXCLUDED_NAMES = frozenset({'object', 'Exception', 'dict', 'list', 'set'})
+# Standard library modules, then utility/helper and framework/test names (any case)
+_CBO_EXCLUDED_RE = re.compile(
+    r'^(?:os|sys|datetime|collections|json|logging|re|math)(?:\.|$)'
+    r'|(?i:utils|helper|test_|mock_|stub_|fake_)'
+)
+# Fan-out matches whole module names, so that e.g. 'osmotic' is not taken for 'os'
+_FANOUT_STDLIB_MODULES = frozenset({'os', 'sys', 'datetime', 'collections', 'json', 'logging'})
+_FANOUT_STDLIB_PREFIXES = ('os.', 'sys.', 'datetime.', 'collections.', 'json.', 'logging.')
+
+# Encodings tried, in order, when a source file has to be decoded
+_SOURCE_ENCODINGS = ('utf-8', 'utf-8-sig', 'latin1', 'cp1252')
+
+# Line breaks of str.splitlines other than '\n' (UTF-8 encoded for the last three),
+# including '\r' of Windows and old Mac line endings
+_OTHER_LINE_BREAKS_RE = re.compile(rb'[\r\v\f\x1c-\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]')
+
+# Kind of a stripped source line, from its prefix (no match means code)
+_LINE_KIND_RE = re.compile(r'(?P<doc>"""|\'\'\')|(?P<imports>import |from )|(?P<comment>#)')
+
 @dataclass
 class StructuralSmell:
     """
@@ -30,6 +67,591 @@ class StructuralSmell:
     line_number: int = None
     severity: str = ''
 
+@dataclass
+class MethodInfo:
+    """
+    Summary of a method definition reduced to primitive values.
+
+    Detectors read these precomputed values instead of walking the method's AST,
+    and the summary can be pickled across process boundaries.
+
+    Attributes:
+        name (str): The name of the method.
+        lineno (int): The line number of the method definition.
+        arg_count (int): The number of positional parameters (including 'self').
+        is_property (bool): Whether the method is decorated with @property.
+        is_special (bool): Whether the method is a special (dunder) method.
+        cc (int): The cyclomatic complexity of the method.
+        has_control_flow (bool): Whether the method contains if/while/for/try statements.
+        branch_count (int): The number of branches in the method.
+        max_nesting (int): The maximum branch nesting level.
+        attributes (set): Names of all attributes accessed in the method.
+        self_attributes (dict): Number of accesses per attribute of 'self'.
+        call_bases (set): Base objects of attribute calls (direct coupling).
+        attribute_bases (set): Base objects of attribute accesses (indirect coupling).
+        calls (set): Names of the attributes called in the method.
+    """
+    name: str
+    lineno: int
+    arg_count: int
+    is_property: bool
+    is_special: bool
+    cc: int
+    has_control_flow: bool
+    branch_count: int
+    max_nesting: int
+    attributes: set = field(default_factory=set)
+    self_attributes: dict = field(default_factory=dict)
+    call_bases: set = field(default_factory=set)
+    attribute_bases: set = field(default_factory=set)
+    calls: set = field(default_factory=set)
+
+@dataclass
+class ClassFacts:
+    """
+    Information extracted from a class definition.
+
+    Attributes:
+        name (str): The name of the class (without its module).
+        methods (list): A list of MethodInfo for each method.
+        fields (set): Names of the class-level fields.
+        base_classes (list): Resolved names of the base classes.
+        loc (int): The number of lines of the class definition.
+    """
+    name: str
+    methods: list
+    fields: set
+    base_classes: list
+    loc: int
+
+class ClassRecord:
+    """
+    Project-wide information about a class, as read by the detectors.
+
+    Records replace the per-class dicts of ``class_info`` and still support reading
+    them by key, e.g. ``info['base_classes']``. The entries of ``methods`` are
+    MethodInfo summaries rather than AST nodes.
+
+    Attributes:
+        methods (list): A list of MethodInfo for each method.
+        regular_methods (list): The methods that are neither special methods nor properties.
+        fields (set): Names of the class-level fields.
+        method_calls (defaultdict): Names called by each method, keyed by method name.
+        base_classes (list): Resolved names of the base classes.
+        loc (int): The number of lines of the class definition.
+    """
+    # Attributes are read in the detectors' inner loops
+    __slots__ = ('methods', 'regular_methods', 'fields', 'method_calls', 'base_classes', 'loc')
+
+    def __init__(self, methods=None, regular_methods=None, fields=None, base_classes=None, loc=0):
+        self.methods = methods if methods is not None else []
+        self.regular_methods = regular_methods if regular_methods is not None else []
+        self.fields = fields if fields is not None else set()
+        self.method_calls = defaultdict(set)
+        self.base_classes = base_classes if base_classes is not None else []
+        self.loc = loc
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+@dataclass
+class FileFacts:
+    """
+    Information extracted from a single Python file.
+
+    Attributes:
+        file_path (str): The path to the file.
+        loc (int): The number of lines in the file.
+        imports (list): Names of the imported modules.
+        classes (list): A list of ClassFacts for each class in the file.
+        line_stats (LineStats, optional): Line counts by kind, used by the LOC and file length detectors.
+    """
+    file_path: str
+    loc: int
+    imports: list
+    classes: list
+    line_stats: 'LineStats' = None
+
+class LineStats(NamedTuple):
+    """
+    Line counts of a source file, by kind.
+
+    Attributes:
+        total (int): The number of lines.
+        blank (int): Blank lines.
+        doc (int): Docstring lines, including the lines opening and closing them.
+        imports (int): Import lines.
+        code (int): The remaining lines that are not comments.
+    """
+    total: int
+    blank: int
+    doc: int
+    imports: int
+    code: int
+
+    @property
+    def meaningful(self):
+        """int: Lines that are neither blank, comments nor docstrings."""
+        return self.code + self.imports
+
+def _base_object_name(node):
+    """
+    Get the base object name from an attribute node, walking down the attribute chain.
+
+    Returns None for chains that start from ``self`` or from anything but a name.
+    """
+    if not isinstance(node, ast.Attribute):
+        return None
+    value = node.value
+    while isinstance(value, ast.Attribute):
+        value = value.value
+    if isinstance(value, ast.Name) and value.id != 'self':
+        return value.id
+    return None
+
+def _resolve_base_class(base_node):
+    """Resolve the name of a base class from its AST node (see StructuralSmellDetector.resolve_base_class)."""
+    if isinstance(base_node, ast.Name):
+        return base_node.id
+    elif isinstance(base_node, ast.Attribute):
+        # Handle module.class syntax
+        return f"{_base_object_name(base_node)}.{base_node.attr}"
+    return str(base_node)
+
+def _count_lines(source):
+    """
+    Count the lines of a source as ``len(content.splitlines())`` does.
+
+    Sources whose only line breaks are newlines, i.e. nearly all of them, are
+    counted on the bytes without decoding or splitting them (a last line without
+    a newline counts).
+
+    Args:
+        source (bytes): The raw content of the source file.
+
+    Returns:
+        int: The number of lines.
+    """
+    if not source:
+        return 0
+    if _OTHER_LINE_BREAKS_RE.search(source) is None:
+        return source.count(b'\n') + (not source.endswith(b'\n'))
+    for encoding in _SOURCE_ENCODINGS:
+        try:
+            return len(source.decode(encoding).splitlines())
+        except UnicodeDecodeError:
+            continue
+    return source.count(b'\n') + (not source.endswith(b'\n'))
+
+def _classify_lines(stripped_lines):
+    """Count stripped lines by kind, one at a time, tracking docstrings."""
+    total = blank = doc = imports = code = 0
+    in_docstring = False
+    match_kind = _LINE_KIND_RE.match
+    for stripped in stripped_lines:
+        total += 1
+        if not stripped:
+            blank += 1
+            continue
+        match = match_kind(stripped)
+        if match is None:
+            if in_docstring:
+                doc += 1
+            else:
+                code += 1
+            continue
+        kind = match.lastgroup
+        if kind == 'doc':
+            in_docstring = not in_docstring
+            doc += 1
+        elif in_docstring:
+            doc += 1
+        elif kind == 'imports':
+            imports += 1
+    return LineStats(total, blank, doc, imports, code)
+
+def _scan_line_stats(source):
+    """
+    Count the lines of a source file by kind.
+
+    The content is decoded with the first encoding that fits and split with
+    str.splitlines, which leaves a single Python-level pass over the stripped
+    lines.
+
+    Args:
+        source (bytes): The raw content of the source file.
+
+    Returns:
+        LineStats: The line counts, or None if the content cannot be decoded.
+    """
+    for encoding in _SOURCE_ENCODINGS:
+        try:
+            content = source.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        return _classify_lines(map(str.strip, content.splitlines()))
+    return None
+
+def _read_line_stats(file_path):
+    """
+    Count the lines of a source file by kind (see _scan_line_stats).
+
+    Args:
+        file_path (str): The path to the file.
+
+    Returns:
+        LineStats: The line counts, or None if the file cannot be decoded.
+    """
+    with open(file_path, 'rb') as file:
+        return _scan_line_stats(file.read())
+
+def _propagate_masks(masks, successors):
+    """
+    OR into each node's mask the masks of every node reachable from it.
+
+    Runs an iterative version of Tarjan's strongly connected components algorithm
+    over index-based adjacency lists. Components are completed in reverse
+    topological order, so each one only has to combine its members' masks with
+    the final masks of its direct successors.
+
+    Args:
+        masks (list): An int bitmask per node.
+        successors (list): The successor indices of each node.
+
+    Returns:
+        list: The propagated masks, by node index.
+    """
+    count = len(masks)
+    result = list(masks)
+    index = [-1] * count
+    low = [0] * count
+    on_stack = [False] * count
+    component_stack = []
+    next_index = 0
+
+    for root in range(count):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = next_index
+        next_index += 1
+        component_stack.append(root)
+        on_stack[root] = True
+        # (node, position of the next successor to explore)
+        work = [(root, 0)]
+
+        while work:
+            node, position = work[-1]
+            node_successors = successors[node]
+            while position < len(node_successors):
+                successor = node_successors[position]
+                position += 1
+                if index[successor] == -1:
+                    work[-1] = (node, position)
+                    index[successor] = low[successor] = next_index
+                    next_index += 1
+                    component_stack.append(successor)
+                    on_stack[successor] = True
+                    work.append((successor, 0))
+                    break
+                if on_stack[successor] and index[successor] < low[node]:
+                    low[node] = index[successor]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    # node is the root of a component: every component reachable
+                    # from it is complete, so its successors' masks are final
+                    members = []
+                    mask = 0
+                    while True:
+                        member = component_stack.pop()
+                        on_stack[member] = False
+                        members.append(member)
+                        mask |= result[member]
+                        if member == node:
+                            break
+                    for member in members:
+                        for successor in successors[member]:
+                            mask |= result[successor]
+                    for member in members:
+                        result[member] = mask
+
+    return result
+
+def _mask_bits(mask):
+    """Split an int bitmask into the list of its set bits (as single-bit ints)."""
+    bits = []
+    while mask:
+        low = mask & -mask
+        bits.append(low)
+        mask ^= low
+    return bits
+
+# Node types _MethodFacts reacts to; every other node is only traversed
+_IF, _LOOP, _TRY, _EXCEPT, _BOOL_OP, _CALL, _ATTRIBUTE, _SCOPE = range(8)
+_METHOD_FACT_KINDS = {
+    ast.If: _IF,
+    ast.For: _LOOP,
+    ast.While: _LOOP,
+    ast.Try: _TRY,
+    ast.ExceptHandler: _EXCEPT,
+    ast.BoolOp: _BOOL_OP,
+    ast.Call: _CALL,
+    ast.Attribute: _ATTRIBUTE,
+    ast.FunctionDef: _SCOPE,
+    ast.AsyncFunctionDef: _SCOPE,
+    ast.Lambda: _SCOPE,
+}
+
+class _MethodFacts:
+    """
+    Collect everything the detectors need from a method in a single traversal.
+
+    The method is traversed in preorder with an explicit stack of child
+    iterators and a type-keyed dispatch table, rather than ast.NodeVisitor's
+    recursive call and method lookup per node.
+
+    Attributes:
+        cc (int): The cyclomatic complexity of the method.
+        has_control_flow (bool): Whether the method contains if/while/for/try statements.
+        branch_count (int): The number of branches in the method.
+        max_nesting (int): The maximum branch nesting level.
+        attributes (set): Names of all attributes accessed in the method.
+        self_attrs (dict): Number of accesses per attribute of 'self'.
+        call_bases (set): Base objects of attribute calls, including those made inside
+            nested functions and lambdas.
+        attribute_bases (set): Base objects of attribute accesses.
+        calls (set): Names of the attributes called in the method. Calls made inside
+            nested functions and lambdas belong to those and are not collected.
+    """
+
+    def __init__(self, method):
+        cc = 1  # Base complexity
+        has_control_flow = False
+        branch_count = 0
+        attributes = set()
+        self_attrs = {}
+        call_bases = set()
+        attribute_bases = set()
+        calls = set()
+        # (depth, preorder index, nesting delta) of the nodes that change the nesting level
+        nesting_events = []
+        order = 0
+        # Depth of the outermost nested function or lambda being traversed, if any
+        nested_depth = None
+
+        kind_of = _METHOD_FACT_KINDS.get
+        stack = [iter((method,))]
+        while stack:
+            for node in stack[-1]:
+                break
+            else:
+                stack.pop()
+                if nested_depth is not None and len(stack) <= nested_depth:
+                    nested_depth = None
+                continue
+
+            order += 1
+            depth = len(stack)
+            kind = kind_of(type(node))
+            if kind is None:
+                pass
+            elif kind == _ATTRIBUTE:
+                attributes.add(node.attr)
+                base = _base_object_name(node)
+                if base:
+                    attribute_bases.add(base)
+                if isinstance(node.value, ast.Name) and node.value.id == 'self':
+                    self_attrs[node.attr] = self_attrs.get(node.attr, 0) + 1
+            elif kind == _CALL:
+                if isinstance(node.func, ast.Attribute):
+                    # Objects used in nested functions still couple the class to them
+                    base = _base_object_name(node.func)
+                    if base:
+                        call_bases.add(base)
+                    if nested_depth is None:
+                        calls.add(node.func.attr)
+            elif kind == _IF:
+                # Count elif branches
+                elifs = sum(1 for handler in node.orelse if isinstance(handler, ast.If))
+                cc += 1 + elifs
+                has_control_flow = True
+                branch_count += 1 + elifs
+                nesting_events.append((depth, order, 1))
+            elif kind == _LOOP:
+                cc += 1
+                has_control_flow = True
+                branch_count += 1
+                nesting_events.append((depth, order, 1))
+            elif kind == _TRY:
+                # Except blocks count as branches; their complexity is added per handler
+                has_control_flow = True
+                branch_count += 1 + len(node.handlers)
+                nesting_events.append((depth, order, 1))
+            elif kind == _EXCEPT:
+                cc += 1
+            elif kind == _BOOL_OP:
+                cc += len(node.values) - 1
+            elif node is not method:
+                if isinstance(node, ast.FunctionDef):
+                    nesting_events.append((depth, order, -1))
+                if nested_depth is None:
+                    nested_depth = depth
+
+            stack.append(ast.iter_child_nodes(node))
+
+        self.cc = cc
+        self.has_control_flow = has_control_flow
+        self.branch_count = branch_count
+        self.max_nesting = self._replay_nesting(nesting_events)
+        self.attributes = attributes
+        self.self_attrs = self_attrs
+        self.call_bases = call_bases
+        self.attribute_bases = attribute_bases
+        self.calls = calls
+
+    @staticmethod
+    def _replay_nesting(nesting_events):
+        # Nesting is tracked in breadth-first order (as ast.walk yields nodes),
+        # which for a tree is the (depth, preorder index) order.
+        current_nesting = 0
+        max_nesting = 0
+        for _, _, delta in sorted(nesting_events):
+            current_nesting = max(0, current_nesting + delta)
+            max_nesting = max(max_nesting, current_nesting)
+        return max_nesting
+
+def _summarize_method(node):
+    """
+    Reduce a method definition node to a MethodInfo.
+
+    Args:
+        node (ast.FunctionDef): The method definition node.
+
+    Returns:
+        MethodInfo: The primitive summary of the method.
+    """
+    facts = _MethodFacts(node)
+    return MethodInfo(
+        name=node.name,
+        lineno=node.lineno,
+        arg_count=len(node.args.args),
+        is_property=any(isinstance(d, ast.Name) and d.id == 'property' 
+                        for d in node.decorator_list),
+        is_special=node.name.startswith('__') and node.name.endswith('__'),
+        cc=facts.cc,
+        has_control_flow=facts.has_control_flow,
+        branch_count=facts.branch_count,
+        max_nesting=facts.max_nesting,
+        attributes=facts.attributes,
+        self_attributes=facts.self_attrs,
+        call_bases=facts.call_bases,
+        attribute_bases=facts.attribute_bases,
+        calls=facts.calls
+    )
+
+def _summarize_class(node):
+    """
+    Extract the information the detectors need from a class definition node.
+
+    Args:
+        node (ast.ClassDef): The class definition node.
+
+    Returns:
+        ClassFacts: The extracted class information.
+    """
+    facts = ClassFacts(
+        name=node.name,
+        methods=[],
+        fields=set(),
+        base_classes=[_resolve_base_class(base) for base in node.bases],
+        loc=node.end_lineno - node.lineno + 1
+    )
+
+    for child in node.body:
+        if isinstance(child, ast.FunctionDef):
+            facts.methods.append(_summarize_method(child))
+        elif isinstance(child, ast.Assign):
+            for target in child.targets:
+                if isinstance(target, ast.Name):
+                    facts.fields.add(target.id)
+
+    return facts
+
+def _extract_file_facts(file_path, cache=None):
+    """
+    Parse a Python file and extract its structural information.
+
+    When a cache is given, the facts are looked up by the hash of the file
+    content before parsing, and stored after a miss.
+
+    Args:
+        file_path (str): The path to the Python file to be analyzed.
+        cache (AnalysisCache, optional): The cache of previously extracted facts.
+
+    Returns:
+        FileFacts: The information extracted from the file.
+
+    Raises:
+        CodeAnalysisError: If the file cannot be read or parsed.
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            source = file.read()
+
+        if cache is not None:
+            cache_key = cache.key(source)
+            facts = cache.get(cache_key)
+            if facts is not None:
+                facts.file_path = file_path
+                return facts
+
+        try:
+            # Parsing the bytes lets ast handle the encoding (UTF-8 by default)
+            tree = ast.parse(source)
+        except SyntaxError as e:
+            logger.error(f"Syntax error in {file_path}: {str(e)}")
+            raise CodeAnalysisError(
+                message=f"Parse error: {str(e)}",
+                file_path=file_path,
+                line_number=getattr(e, 'lineno', None)
+            )
+
+        facts = FileFacts(file_path=file_path, loc=_count_lines(source), imports=[], classes=[],
+                          line_stats=_scan_line_stats(source))
+
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                facts.classes.append(_summarize_class(node))
+            elif isinstance(node, ast.Import):
+                for alias in node.names:
+                    facts.imports.append(alias.name)
+            elif isinstance(node, ast.ImportFrom):
+                if node.module:
+                    facts.imports.append(node.module)
+
+        if cache is not None:
+            cache.put(cache_key, facts)
+        return facts
+                    
+    except UnicodeDecodeError as e:
+        logger.error(f"Encoding error in {file_path}: {str(e)}")
+        raise CodeAnalysisError(
+            message=f"File encoding error: {str(e)}",
+            file_path=file_path
+        )
+    except Exception as e:
+        logger.error(f"Error analyzing file {file_path}: {str(e)}")
+        raise CodeAnalysisError(
+            message=f"Analysis error: {str(e)}",
+            file_path=file_path
+        )
+
 class StructuralSmellDetector:
     """
     A class to detect structural smells in Python code.
@@ -39,29 +661,55 @@ class StructuralSmellDetector:
 
     Attributes:
         structural_smells (list): A list to store detected structural smells.
-        class_info (defaultdict): A dictionary to store information about classes.
+        class_info (defaultdict): A ClassRecord for each class, keyed by qualified class name.
         module_info (defaultdict): A dictionary to store information about modules.
         dependency_graph (nx.DiGraph): A directed graph to represent module dependencies.
+        module_dependencies (nx.DiGraph): The same graph as dependency_graph.
         thresholds (dict): A dictionary of threshold values for various smell detections.
         project_root (str): The root directory of the project being analyzed.
         file_paths (dict): A dictionary to store file paths of modules and classes.
+        class_to_file (dict): The file path of each class, keyed by qualified class name.
+        jobs (int): The number of worker processes used to parse files.
+        cache_dir (str): The directory of the on-disk facts cache, or None to disable it.
     """
 
-    def __init__(self, config):
+    PARALLEL_MIN_FILES = PARALLEL_MIN_FILES
+    PARALLEL_CHUNKSIZE = PARALLEL_CHUNKSIZE
+
+    def __init__(self, config, jobs=None, cache_dir=None, cache_results=False):
         """
         Initialize the StructuralSmellDetector with given configuration.
 
         Args:
             config (dict or str): Either a dictionary of thresholds or a path to a YAML config file.
+            jobs (int, optional): The number of worker processes used to parse files
+                (default: the number of CPUs). Use 1 to parse in-process.
+            cache_dir (str, optional): Directory where extracted facts are cached
+                between runs, keyed by file content. Caching is disabled when None.
+            cache_results (bool, optional): Also cache the detected smells in cache_dir
+                and reuse them while no Python file changes (see detect_smells).
         """
         self.structural_smells = []
-        self.class_info = defaultdict(dict)
+        self.class_info = defaultdict(ClassRecord)
         self.module_info = defaultdict(dict)
-        self.dependency_graph = nx.DiGraph()
         self.module_dependencies = nx.DiGraph()
+        # Both attributes refer to the same graph
+        self.dependency_graph = self.module_dependencies
         self.thresholds = self.load_thresholds(config)
         self.project_root = None
         self.file_paths = {}
+        self.class_to_file = {}
+        self.class_to_module = {}
+        self._degrees = None
+        self._total_production_loc = None
+        self._line_stats_cache = {}
+        # Cyclomatic complexity of the AST methods passed to calculate_cyclomatic_complexity
+        self._complexity_cache = weakref.WeakKeyDictionary()
+        self.jobs = jobs or os.cpu_count() or 1
+        self.cache_dir = cache_dir
+        self.cache_results = cache_results
+        # Smells of the current run, kept while they are to be cached
+        self._recorded_smells = None
 
     def load_thresholds(self, config):
         """
@@ -79,8 +727,7 @@ class StructuralSmellDetector:
         if isinstance(config, dict):
             return config
         elif isinstance(config, str):
-            with open(config, 'r') as file:
-                config_data = yaml.safe_load(file)
+            config_data = read_config(config)
             return {k: v['value'] for k, v in config_data['structural_smells'].items()}
         else:
             raise ValueError("Config must be either a dictionary or a file path string")
@@ -88,6 +735,12 @@ class StructuralSmellDetector:
     def detect_smells(self, directory_path):
         """
         Detect structural smells in the given directory.
+
+        When cache_results is set, the smells of a run are cached under the
+        thresholds and the path, modification time and size of every Python
+        file. When nothing changed, the cached smells are reported without
+        parsing any file, and the other attributes (class_info, module_info...)
+        are left empty.
         """
         detection_methods = [
             (self.detect_nom, "detect_nom"),
@@ -104,7 +757,20 @@ class StructuralSmellDetector:
             (self.detect_branches, "detect_branches")
         ]
 
+        results_cache = None
+        if self.cache_dir and self.cache_results:
+            results_cache = AnalysisCache(self.cache_dir, namespace='structural-results')
+
         try:
+            if results_cache is not None:
+                results_key = self._results_key(directory_path, results_cache)
+                cached_smells = results_cache.get(results_key)
+                if cached_smells is not None:
+                    logger.info(f"No Python file changed in {directory_path}, reusing the cached smells")
+                    self.structural_smells.extend(cached_smells)
+                    return
+                self._recorded_smells = []
+
             # First analyze the directory structure
             logger.info(f"Analyzing directory structure: {directory_path}")
             self.analyze_directory(directory_path)
@@ -114,6 +780,7 @@ class StructuralSmellDetector:
                 return
             
             # Then run each detection method
+            complete = True
             for detect_method, method_name in detection_methods:
                 try:
                     logger.debug(f"Running {method_name}")
@@ -121,8 +788,13 @@ class StructuralSmellDetector:
                     logger.debug(f"Completed {method_name}. Total smells so far: {len(self.structural_smells)}")
                 except Exception as e:
                     logger.error(f"Error in {method_name}: {str(e)}", exc_info=True)
+                    complete = False
                     # Continue with next detection method instead of stopping
                     continue
+
+            # Results missing a failed detector are not worth reusing
+            if self._recorded_smells is not None and complete:
+                results_cache.put(results_key, self._recorded_smells)
                 
         except Exception as e:
             logger.error(f"Error analyzing directory {directory_path}: {str(e)}", exc_info=True)
@@ -130,40 +802,82 @@ class StructuralSmellDetector:
                 message=str(e),
                 file_path=directory_path
             )
+        finally:
+            self._recorded_smells = None
 
         # Log final results
         logger.info(f"Analysis complete. Found {len(self.structural_smells)} structural smells.")
 
+    def _results_key(self, directory_path, cache):
+        """
+        Compute the cache key of the smells of a directory.
+
+        The key covers the project root, the thresholds and the stat signature
+        (path, modification time and size) of every Python file, so checking it
+        costs one stat per file.
+
+        Args:
+            directory_path (str): The path to the analyzed directory.
+            cache (AnalysisCache): The cache of the results.
+
+        Returns:
+            str: The cache key.
+        """
+        signature = []
+        for entry in iter_python_files(directory_path):
+            stat = entry.stat()
+            signature.append((entry.path, stat.st_mtime_ns, stat.st_size))
+        signature.sort()
+        thresholds = sorted(self.thresholds.items(), key=lambda item: str(item[0]))
+        return cache.key(repr((os.path.abspath(directory_path), thresholds, signature)).encode())
+
     def analyze_directory(self, directory_path):
         """
         Analyze all Python files in the given directory and its subdirectories.
 
+        The directory is walked serially, then the files are parsed in parallel
+        worker processes and their results are merged on the main process.
+
         Args:
             directory_path (str): The path to the directory to be analyzed.
         """
         self.project_root = os.path.abspath(directory_path)
         files_analyzed = 0
         files_with_errors = 0
+        files_skipped = 0
+        max_file_size = self.thresholds.get('MAX_FILE_SIZE', DEFAULT_MAX_FILE_SIZE)
+        file_paths = []
         
         logger.info(f"Starting analysis of directory: {directory_path}")
         
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                if file.endswith('.py'):
-                    file_path = os.path.join(root, file)
-                    try:
-                        self.analyze_file(file_path)
-                        files_analyzed += 1
-                        logger.debug(f"Successfully analyzed: {file_path}")
-                    except CodeAnalysisError as e:
-                        files_with_errors += 1
-                        logger.warning(f"Error analyzing {file_path}: {str(e)}")
-                        # Continue with next file instead of stopping
-                        continue
-                    except Exception as e:
-                        files_with_errors += 1
-                        logger.error(f"Unexpected error analyzing {file_path}: {str(e)}")
-                        continue
+        for entry in iter_python_files(directory_path):
+            file_path = entry.path
+            size = entry.stat().st_size
+            if size == 0:
+                # Empty modules (e.g. bare __init__.py) have nothing to parse
+                logger.debug(f"Empty file, registering without parsing: {file_path}")
+                self._register_module(file_path, loc=0)
+                files_analyzed += 1
+                continue
+            if should_skip_file(file_path, entry.name, size, max_file_size):
+                files_skipped += 1
+                continue
+            file_paths.append(file_path)
+
+        for file_path, (facts, error) in zip(file_paths, self._parse_files(file_paths)):
+            if error is not None:
+                files_with_errors += 1
+                logger.warning(f"Error analyzing {file_path}: {str(error)}")
+                # Continue with next file instead of stopping
+                continue
+            try:
+                self._merge_file_facts(facts)
+                files_analyzed += 1
+                logger.debug(f"Successfully analyzed: {file_path}")
+            except Exception as e:
+                files_with_errors += 1
+                logger.error(f"Unexpected error analyzing {file_path}: {str(e)}")
+                continue
 
         # Log analysis summary
         logger.info(f"""
@@ -171,6 +885,7 @@ Analysis Summary:
 ----------------
 Files analyzed: {files_analyzed}
 Files with errors: {files_with_errors}
+Files skipped: {files_skipped}
 Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) * 100):.1f}%
         """)
 
@@ -179,6 +894,20 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         elif files_with_errors > 0:
             logger.warning(f"{files_with_errors} files could not be analyzed due to errors")
 
+    def _parse_files(self, file_paths):
+        """
+        Extract the facts of the given files, in worker processes when worthwhile.
+
+        Args:
+            file_paths (list): The paths of the Python files to parse.
+
+        Returns:
+            iterator: (FileFacts or None, CodeAnalysisError or None) tuples, in input order.
+        """
+        return parse_files(_extract_file_facts, 'structural', file_paths, self.cache_dir, self.jobs,
+                           errors=CodeAnalysisError, min_files=self.PARALLEL_MIN_FILES,
+                           chunksize=self.PARALLEL_CHUNKSIZE)
+
     def analyze_file(self, file_path):
         """
         Analyze a single Python file for structural information.
@@ -186,55 +915,52 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         Args:
             file_path (str): The path to the Python file to be analyzed.
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            
-            try:
-                tree = ast.parse(content)
-            except SyntaxError as e:
-                logger.error(f"Syntax error in {file_path}: {str(e)}")
-                raise CodeAnalysisError(
-                    message=f"Parse error: {str(e)}",
-                    file_path=file_path,
-                    line_number=getattr(e, 'lineno', None)
-                )
-            
-            # Get relative module path
-            rel_path = os.path.relpath(file_path, self.project_root)
-            module_name = os.path.splitext(rel_path)[0].replace(os.path.sep, '.')
-            
-            self.module_info[module_name]['loc'] = len(content.splitlines())
-            self.file_paths[module_name] = file_path
-            
-            # Add node to dependency graph
-            self.module_dependencies.add_node(module_name)
-            self.dependency_graph.add_node(module_name)
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    self.analyze_class(node, module_name)
-                elif isinstance(node, ast.Import):
-                    for alias in node.names:
-                        self.dependency_graph.add_edge(module_name, alias.name)
-                        self.module_dependencies.add_edge(module_name, alias.name)
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        self.dependency_graph.add_edge(module_name, node.module)
-                        self.module_dependencies.add_edge(module_name, node.module)
-                        
-        except UnicodeDecodeError as e:
-            logger.error(f"Encoding error in {file_path}: {str(e)}")
-            raise CodeAnalysisError(
-                message=f"File encoding error: {str(e)}",
-                file_path=file_path
-            )
-        except Exception as e:
-            logger.error(f"Error analyzing file {file_path}: {str(e)}")
-            raise CodeAnalysisError(
-                message=f"Analysis error: {str(e)}",
-                file_path=file_path
-            )
+        self._merge_file_facts(load_file_facts(_extract_file_facts, 'structural', file_path,
+                                               self.cache_dir))
+
+    def _merge_file_facts(self, facts):
+        """
+        Merge the facts extracted from a file into the project-wide structures.
+
+        Args:
+            facts (FileFacts): The information extracted from the file.
+        """
+        module_name = self._register_module(facts.file_path, loc=facts.loc)
+        if facts.line_stats is not None:
+            # Counted by the worker that parsed the file, while the source was in memory
+            self._line_stats_cache[module_name] = facts.line_stats
+
+        for class_facts in facts.classes:
+            self._merge_class_facts(class_facts, module_name)
+
+        edges = [(module_name, import_name) for import_name in facts.imports]
+        self.module_dependencies.add_edges_from(edges)
+
+    def _register_module(self, file_path, loc):
+        """
+        Register a module, its file path and its node in the dependency graphs.
+
+        Args:
+            file_path (str): The path to the Python file.
+            loc (int): The number of lines in the file.
+
+        Returns:
+            str: The module name relative to the project root.
+        """
+        # Get relative module path
+        rel_path = os.path.relpath(file_path, self.project_root)
+        module_name = os.path.splitext(rel_path)[0].replace(os.path.sep, '.')
+        
+        self.module_info[module_name]['loc'] = loc
+        self.file_paths[module_name] = file_path
+        # The dependency graphs and project size are changing
+        self._degrees = None
+        self._total_production_loc = None
+        self._line_stats_cache.pop(module_name, None)
+        
+        # Add node to dependency graph
+        self.module_dependencies.add_node(module_name)
+        return module_name
 
     def analyze_class(self, node, module_name):
         """
@@ -244,21 +970,46 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
             node (ast.ClassDef): The class definition node to analyze.
             module_name (str): The name of the module containing the class.
         """
-        class_name = f"{module_name}.{node.name}"
-        self.class_info[class_name]['methods'] = []
-        self.class_info[class_name]['fields'] = set()
-        self.class_info[class_name]['method_calls'] = defaultdict(set)
-        self.class_info[class_name]['base_classes'] = [self.resolve_base_class(base, module_name) for base in node.bases]
-        self.class_info[class_name]['loc'] = node.end_lineno - node.lineno + 1
-
-        for child in node.body:
-            if isinstance(child, ast.FunctionDef):
-                self.class_info[class_name]['methods'].append(child)
-                self.analyze_method(child, class_name)
-            elif isinstance(child, ast.Assign):
-                for target in child.targets:
-                    if isinstance(target, ast.Name):
-                        self.class_info[class_name]['fields'].add(target.id)
+        self._merge_class_facts(_summarize_class(node), module_name)
+
+    def _merge_class_facts(self, class_facts, module_name):
+        """
+        Store the information extracted from a class in class_info.
+
+        Args:
+            class_facts (ClassFacts): The information extracted from the class.
+            module_name (str): The name of the module containing the class.
+        """
+        class_name = f"{module_name}.{class_facts.name}"
+        record = ClassRecord(
+            methods=class_facts.methods,
+            # Methods other than special methods and properties, shared by NOM and LCOM
+            regular_methods=[m for m in class_facts.methods if not (m.is_special or m.is_property)],
+            fields=class_facts.fields,
+            base_classes=class_facts.base_classes,
+            loc=class_facts.loc
+        )
+        for method in class_facts.methods:
+            record.method_calls[method.name].update(method.calls)
+
+        self.class_info[class_name] = record
+        self.class_to_module[class_name] = module_name
+        self.class_to_file[class_name] = self.file_paths[module_name]
+
+    def _class_file_path(self, class_name):
+        """
+        Get the file defining a class, including base classes only known by name.
+
+        Args:
+            class_name (str): The qualified name of the class (module.Class).
+
+        Returns:
+            str: The path to the file, or "Unknown".
+        """
+        file_path = self.class_to_file.get(class_name)
+        if file_path is None:
+            file_path = self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown")
+        return file_path
 
     def analyze_method(self, node, class_name):
         """
@@ -268,10 +1019,7 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
             node (ast.FunctionDef): The method definition node to analyze.
             class_name (str): The name of the class containing the method.
         """
-        for child in ast.walk(node):
-            if isinstance(child, ast.Call):
-                if isinstance(child.func, ast.Attribute):
-                    self.class_info[class_name]['method_calls'][node.name].add(child.func.attr)
+        self.class_info[class_name].method_calls[node.name].update(_MethodFacts(node).calls)
 
     def add_smell(self, name, description, file_path, module_class, line_number=None, severity='medium'):
         """
@@ -285,14 +1033,17 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
             line_number (int, optional): The line number where the smell was detected
             severity (str, optional): The severity level of the smell (default: 'medium')
         """
-        self.structural_smells.append(StructuralSmell(
+        smell = StructuralSmell(
             name=name,
             description=description,
             file_path=file_path,
             module_class=module_class,
             line_number=line_number,
             severity=severity
-        ))
+        )
+        self.structural_smells.append(smell)
+        if self._recorded_smells is not None:
+            self._recorded_smells.append(smell)
 
     def detect_nom(self):
         """
@@ -306,23 +1057,16 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         logger.info(f"Detecting NOM smells with threshold: {threshold}")
 
         for class_name, info in self.class_info.items():
-            # Filter out special methods and properties
-            regular_methods = [m for m in info['methods'] 
-                             if not (m.name.startswith('__') and m.name.endswith('__')) 
-                             and not any(isinstance(d, ast.Name) and d.id == 'property' 
-                                       for d in getattr(m, 'decorator_list', []))]
-            
-            nom = len(regular_methods)
+            nom = len(info.regular_methods)
             if nom > threshold:
                 severity = 'High' if nom > threshold * 1.5 else 'Medium'
-                smell = StructuralSmell(
+                self.add_smell(
                     name="High Number of Methods (NOM)",
                     description=f"Class '{class_name}' has {nom} methods (excluding special methods and properties)",
-                    file_path=self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
+                    file_path=self.class_to_file.get(class_name, "Unknown"),
                     module_class=class_name,
                     severity=severity
                 )
-                self.structural_smells.append(smell)
                 logger.info(f"Detected NOM smell in {class_name}: {nom} methods")
 
     def detect_wmpc(self):
@@ -334,25 +1078,14 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         Considers method visibility and excludes simple getter/setter methods.
         """
         for class_name, info in self.class_info.items():
-            # Filter out simple getters/setters and special methods
-            complex_methods = []
-            for method in info['methods']:
-                # Skip special methods
-                if method.name.startswith('__') and method.name.endswith('__'):
+            wmpc1 = 0
+            wmpc2 = 0
+            for method in info.methods:
+                # Skip special methods and simple getters/setters
+                if method.is_special or not method.has_control_flow:
                     continue
-                
-                # Check if it's a simple getter/setter
-                is_simple = True
-                for node in ast.walk(method):
-                    if isinstance(node, (ast.If, ast.While, ast.For, ast.Try)):
-                        is_simple = False
-                        break
-                
-                if not is_simple:
-                    complex_methods.append(method)
-
-            wmpc1 = sum(self.calculate_cyclomatic_complexity(method) for method in complex_methods)
-            wmpc2 = sum(len(method.args.args) - 1 for method in complex_methods)  # Subtract 1 for 'self'
+                wmpc1 += method.cc
+                wmpc2 += method.arg_count - 1  # Subtract 1 for 'self'
             
             if wmpc1 > self.thresholds['WMPC1_THRESHOLD'] or wmpc2 > self.thresholds['WMPC2_THRESHOLD']:
                 severity = 'High' if (wmpc1 > self.thresholds['WMPC1_THRESHOLD'] * 1.5 or 
@@ -360,7 +1093,7 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
                 self.add_smell(
                     "High Weighted Methods per Class (WMPC)",
                     f"Class '{class_name}' has complex methods (WMPC1: {wmpc1}, WMPC2: {wmpc2})",
-                    self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
+                    self.class_to_file.get(class_name, "Unknown"),
                     class_name,
                     severity=severity
                 )
@@ -374,17 +1107,13 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         """
         for class_name, info in self.class_info.items():
             # Count significant members (excluding private/protected members with limited usage)
-            significant_methods = [m for m in info['methods'] 
-                                if not m.name.startswith('_') or 
-                                any(call for calls in info['method_calls'].values() 
-                                    for call in calls if call == m.name)]
+            called_methods = set().union(*info.method_calls.values())
+            significant_methods = [m for m in info.methods 
+                                if not m.name.startswith('_') or m.name in called_methods]
             
-            significant_fields = {f for f in info['fields'] 
-                                if not f.startswith('_') or 
-                                any(node.attr == f 
-                                    for method in info['methods'] 
-                                    for node in ast.walk(method) 
-                                    if isinstance(node, ast.Attribute))}
+            used_attributes = set().union(*(method.attributes for method in info.methods))
+            significant_fields = {f for f in info.fields 
+                                if not f.startswith('_') or f in used_attributes}
             
             size2 = len(significant_methods) + len(significant_fields)
             if size2 > self.thresholds['SIZE2_THRESHOLD']:
@@ -392,7 +1121,7 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
                 self.add_smell(
                     "Large Class (SIZE2)",
                     f"Class '{class_name}' has {size2} significant members (methods: {len(significant_methods)}, fields: {len(significant_fields)})",
-                    self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
+                    self.class_to_file.get(class_name, "Unknown"),
                     class_name,
                     severity=severity
                 )
@@ -407,22 +1136,17 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         for class_name, info in self.class_info.items():
             # Filter fields based on visibility and usage
             significant_fields = set()
+            field_usage = Counter()
+            for method in info.methods:
+                field_usage.update(method.self_attributes)
             
-            for field in info['fields']:
+            for field in info.fields:
                 # Skip constants (uppercase fields)
                 if field.isupper():
                     continue
                 
-                # Check field usage in methods
-                field_usage = sum(1 for method in info['methods']
-                                for node in ast.walk(method)
-                                if isinstance(node, ast.Attribute) and 
-                                isinstance(node.value, ast.Name) and 
-                                node.value.id == 'self' and 
-                                node.attr == field)
-                
                 # Include field if it's public or frequently used
-                if not field.startswith('_') or field_usage > 1:
+                if not field.startswith('_') or field_usage[field] > 1:
                     significant_fields.add(field)
             
             wac = len(significant_fields)
@@ -431,7 +1155,7 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
                 self.add_smell(
                     "High Weight of a Class (WAC)",
                     f"Class '{class_name}' has {wac} significant attributes (excluding constants and unused private fields)",
-                    self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
+                    self.class_to_file.get(class_name, "Unknown"),
                     class_name,
                     severity=severity
                 )
@@ -446,11 +1170,7 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         - Constructor field initialization
         """
         for class_name, info in self.class_info.items():
-            # Filter out special methods and properties
-            regular_methods = [m for m in info['methods'] 
-                             if not (m.name.startswith('__') and m.name.endswith('__'))
-                             and not any(isinstance(d, ast.Name) and d.id == 'property' 
-                                       for d in getattr(m, 'decorator_list', []))]
+            regular_methods = info.regular_methods
             
             if len(regular_methods) < 2:  # Skip classes with too few methods
                 continue
@@ -458,23 +1178,35 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
             # Build field usage map including indirect access
             method_field_usage = self._build_field_usage_map(regular_methods, info)
             
-            # Calculate cohesion metrics
+            # Calculate cohesion metrics from the methods using each field, with
+            # method sets as bitmasks over the method indices
+            names = [m.name for m in regular_methods]
+            field_bits = {name: _mask_bits(mask) for name, mask in method_field_usage.items()}
+            field_methods = defaultdict(int)
+            public_methods = 0
+            for index, name in enumerate(names):
+                for field_bit in field_bits[name]:
+                    field_methods[field_bit] |= 1 << index
+                if not name.startswith('_'):
+                    public_methods |= 1 << index
+            
             non_cohesive_pairs = 0
             cohesive_pairs = 0
+            all_methods = (1 << len(names)) - 1
             
-            for i, method1 in enumerate(regular_methods):
-                for method2 in regular_methods[i+1:]:
-                    # Skip pairs of private methods as they might be helper methods
-                    if method1.name.startswith('_') and method2.name.startswith('_'):
-                        continue
-                        
-                    shared_fields = method_field_usage[method1.name].intersection(
-                        method_field_usage[method2.name])
-                    
-                    if not shared_fields:
-                        non_cohesive_pairs += 1
-                    else:
-                        cohesive_pairs += 1
+            for index, name in enumerate(names):
+                paired = all_methods & ~((2 << index) - 1)  # Methods after this one
+                # Skip pairs of private methods as they might be helper methods
+                if name.startswith('_'):
+                    paired &= public_methods
+                
+                sharing = 0
+                for field_bit in field_bits[name]:
+                    sharing |= field_methods[field_bit]
+                
+                cohesive = bin(sharing & paired).count('1')
+                cohesive_pairs += cohesive
+                non_cohesive_pairs += bin(paired).count('1') - cohesive
             
             if non_cohesive_pairs == 0 and cohesive_pairs == 0:
                 continue  # Skip classes with no meaningful method pairs
@@ -485,38 +1217,46 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
                 self.add_smell(
                     "High Lack of Cohesion of Methods (LCOM)",
                     f"Class '{class_name}' has LCOM of {lcom} (non-cohesive: {non_cohesive_pairs}, cohesive: {cohesive_pairs})",
-                    self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
+                    self.class_to_file.get(class_name, "Unknown"),
                     class_name,
                     severity=severity
                 )
 
     def _build_field_usage_map(self, methods, info):
-        """Helper method to build comprehensive field usage map."""
-        method_field_usage = {method.name: set() for method in methods}
-        method_calls = info['method_calls']
+        """
+        Helper method to build comprehensive field usage map.
+
+        A method uses the fields it accesses directly plus those of every method it
+        (transitively) calls. The fields are propagated once over the strongly
+        connected components of the call graph (see _propagate_masks).
+
+        Returns:
+            dict: Method name to the bitmask of the fields it uses, with one bit
+                per field of the class.
+        """
+        field_index = {}
+        method_field_usage = {method.name: 0 for method in methods}
+        method_calls = info.method_calls
         
         # First pass: direct field access
         for method in methods:
-            for node in ast.walk(method):
-                if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
-                    if node.value.id == 'self':
-                        method_field_usage[method.name].add(node.attr)
+            fields = 0
+            for field_name in method.self_attributes:
+                fields |= 1 << field_index.setdefault(field_name, len(field_index))
+            method_field_usage[method.name] |= fields
         
         # Second pass: indirect access through method calls
-        changed = True
-        while changed:  # Keep propagating until no changes
-            changed = False
-            for method in methods:
-                current_fields = method_field_usage[method.name].copy()
-                # Add fields used by called methods
-                for called_method in method_calls.get(method.name, set()):
-                    if called_method in method_field_usage:
-                        new_fields = method_field_usage[called_method]
-                        if not new_fields.issubset(current_fields):
-                            method_field_usage[method.name].update(new_fields)
-                            changed = True
-        
-        return method_field_usage
+        names = list(method_field_usage)
+        method_index = {name: index for index, name in enumerate(names)}
+        successors = [[method_index[called_method]
+                       for called_method in method_calls.get(name, ())
+                       if called_method in method_index]
+                      for name in names]
+        if not any(successors):
+            return method_field_usage
+
+        masks = _propagate_masks([method_field_usage[name] for name in names], successors)
+        return dict(zip(names, masks))
 
     def detect_rfc(self):
         """
@@ -527,34 +1267,27 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         - Framework-specific methods
         - Standard library calls
         """
-        standard_lib_prefixes = {'os.', 'sys.', 'datetime.', 'collections.', 'json.'}
-        
         for class_name, info in self.class_info.items():
             # Count significant methods (excluding simple getters/setters)
             significant_methods = []
-            for method in info['methods']:
-                if method.name.startswith('__') and method.name.endswith('__'):
+            for method in info.methods:
+                if method.is_special:
                     continue
                     
                 # Check if it's a simple accessor
-                is_simple = True
-                for node in ast.walk(method):
-                    if isinstance(node, (ast.If, ast.While, ast.For, ast.Try)):
-                        is_simple = False
-                        break
-                
-                if not is_simple or not method.name.startswith('_'):
+                if method.has_control_flow or not method.name.startswith('_'):
                     significant_methods.append(method)
             
             # Count unique external method calls
             external_calls = set()
-            for calls in info['method_calls'].values():
+            method_names = {m.name for m in info.methods}
+            for calls in info.method_calls.values():
                 for call in calls:
                     # Skip standard library calls
-                    if any(call.startswith(prefix) for prefix in standard_lib_prefixes):
+                    if _RFC_STDLIB_CALL_RE.match(call):
                         continue
                     # Skip self calls
-                    if not any(m.name == call for m in info['methods']):
+                    if call not in method_names:
                         external_calls.add(call)
             
             rfc = len(significant_methods) + len(external_calls)
@@ -563,7 +1296,7 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
                 self.add_smell(
                     "High Response for a Class (RFC)",
                     f"Class '{class_name}' has RFC of {rfc} (methods: {len(significant_methods)}, external calls: {len(external_calls)})",
-                    self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
+                    self.class_to_file.get(class_name, "Unknown"),
                     class_name,
                     severity=severity
                 )
@@ -580,21 +1313,24 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         module_class_info = defaultdict(list)
         
         for class_name, info in self.class_info.items():
-            module_name = class_name.rsplit('.', 1)[0]
+            module_name = self.class_to_module.get(class_name)
+            if module_name is None:
+                # Records added to class_info directly have no recorded module
+                module_name = class_name.rsplit('.', 1)[0]
             
             # Skip test classes
             if 'test' in class_name.lower():
                 continue
                 
             # Skip exception classes
-            if any(base.endswith('Exception') for base in info['base_classes']):
+            if any(base.endswith('Exception') for base in info.base_classes):
                 continue
             
             # Calculate class weight based on size and complexity
             class_weight = (
-                len(info['methods']) +
-                len(info['fields']) +
-                sum(self.calculate_cyclomatic_complexity(m) for m in info['methods'])
+                len(info.methods) +
+                len(info.fields) +
+                sum(m.cc for m in info.methods)
             ) / 3  # Normalize
             
             module_class_info[module_name].append((class_name, class_weight))
@@ -631,60 +1367,89 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         - Abstract base classes
         """
         inheritance_graph = nx.DiGraph()
-        framework_bases = {'object', 'Exception', 'dict', 'list', 'set', 'tuple', 'str', 'int', 'float'}
+        framework_bases = _FRAMEWORK_BASES
+        nodes = []
+        edges = []
         
         for class_name, info in self.class_info.items():
-            inheritance_graph.add_node(class_name)
-            significant_bases = []
+            nodes.append(class_name)
             
-            for base in info['base_classes']:
-                # Skip framework/library base classes
-                base_name = base.split('.')[-1]
-                if base_name in framework_bases:
+            for base in info.base_classes:
+                # Skip framework/library base classes, Mixin/Interface classes
+                # and abstract base classes
+                base_name = base.rpartition('.')[2]
+                if base_name in framework_bases or _SKIPPED_BASE_RE.search(base_name):
                     continue
                     
-                # Skip Mixin classes
-                if 'Mixin' in base_name or 'Interface' in base_name:
-                    continue
-                    
-                # Skip abstract base classes (if they have ABC in name or are mostly abstract methods)
-                if 'ABC' in base_name or 'Abstract' in base_name:
-                    continue
-                    
-                significant_bases.append(base)
-                inheritance_graph.add_edge(base, class_name)
+                nodes.append(base)
+                edges.append((base, class_name))
+        
+        inheritance_graph.add_nodes_from(nodes)
+        inheritance_graph.add_edges_from(edges)
         
         # Add 'object' as root if needed
         if 'object' not in inheritance_graph and inheritance_graph.nodes():
-            inheritance_graph.add_node('object')
-            for node in list(inheritance_graph.nodes()):
-                if inheritance_graph.in_degree(node) == 0 and node != 'object':
-                    inheritance_graph.add_edge('object', node)
+            roots = [node for node, degree in inheritance_graph.in_degree() if degree == 0]
+            inheritance_graph.add_edges_from(('object', node) for node in roots)
+        
+        # Depths of all classes from a single breadth-first search
+        dit_map = (nx.single_source_shortest_path_length(inheritance_graph, 'object')
+                   if 'object' in inheritance_graph else {})
         
         for class_name in inheritance_graph.nodes():
-            if class_name != 'object':
-                try:
-                    dit = nx.shortest_path_length(inheritance_graph, 'object', class_name)
-                    if dit > self.thresholds['DIT_THRESHOLD']:
-                        severity = 'High' if dit > self.thresholds['DIT_THRESHOLD'] * 1.5 else 'Medium'
-                        inheritance_path = '->'.join(nx.shortest_path(inheritance_graph, 'object', class_name))
-                        self.add_smell(
-                            "Deep Inheritance Tree (DIT)",
-                            f"Class '{class_name}' has DIT of {dit}\nInheritance path: {inheritance_path}",
-                            self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
-                            class_name,
-                            severity=severity
-                        )
-                except nx.NetworkXNoPath:
-                    # Only report if it's not a framework/library class
-                    if not any(base in class_name for base in framework_bases):
-                        self.add_smell(
-                            "Isolated Class in Inheritance Tree",
-                            f"Class '{class_name}' is isolated from the main inheritance hierarchy",
-                            self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
-                            class_name,
-                            severity='Low'
-                        )
+            if class_name == 'object':
+                continue
+            # Base classes outside class_info fall back to a module lookup
+            dit = dit_map.get(class_name)
+            if dit is None:
+                # No path from the root: only report if it's not a framework/library class
+                if not any(base in class_name for base in framework_bases):
+                    self.add_smell(
+                        "Isolated Class in Inheritance Tree",
+                        f"Class '{class_name}' is isolated from the main inheritance hierarchy",
+                        self._class_file_path(class_name),
+                        class_name,
+                        severity='Low'
+                    )
+            elif dit > self.thresholds['DIT_THRESHOLD']:
+                severity = 'High' if dit > self.thresholds['DIT_THRESHOLD'] * 1.5 else 'Medium'
+                inheritance_path = '->'.join(nx.shortest_path(inheritance_graph, 'object', class_name))
+                self.add_smell(
+                    "Deep Inheritance Tree (DIT)",
+                    f"Class '{class_name}' has DIT of {dit}\nInheritance path: {inheritance_path}",
+                    self._class_file_path(class_name),
+                    class_name,
+                    severity=severity
+                )
+
+    def _compute_line_stats(self, module_name):
+        """
+        Get the line counts of a module, scanning its file on first use.
+
+        The counts are shared by the LOC and file length detectors.
+
+        Args:
+            module_name (str): The name of the module.
+
+        Returns:
+            LineStats: The line counts, or None if the file is missing or cannot be decoded.
+        """
+        if module_name in self._line_stats_cache:
+            return self._line_stats_cache[module_name]
+
+        file_path = self.file_paths.get(module_name, "")
+        stats = None
+        if file_path:
+            # The file was already read while parsing; opening it is the existence check
+            try:
+                stats = _read_line_stats(file_path)
+            except FileNotFoundError:
+                pass
+            else:
+                if stats is None:
+                    logger.warning(f"Could not read file {file_path} with any supported encoding")
+        self._line_stats_cache[module_name] = stats
+        return stats
 
     def detect_loc(self):
         """
@@ -692,66 +1457,15 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         """
         for module_name, info in self.module_info.items():
             try:
-                file_path = self.file_paths.get(module_name, "")
-                if not file_path or not os.path.exists(file_path):
+                stats = self._compute_line_stats(module_name)
+                if stats is None:
                     continue
+                file_path = self.file_paths[module_name]
 
-                # Try different encodings
-                encodings = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252']
-                content = None
-                
-                for encoding in encodings:
-                    try:
-                        with open(file_path, 'r', encoding=encoding) as file:
-                            content = file.read()
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if content is None:
-                    logger.warning(f"Could not read file {file_path} with any supported encoding")
-                    continue
-
-                # Count different types of lines
-                lines = content.splitlines()
-                code_lines = 0
-                doc_lines = 0
-                import_lines = 0
-                blank_lines = 0
-                
-                in_docstring = False
-                for line in lines:
-                    stripped = line.strip()
-                    
-                    # Skip blank lines
-                    if not stripped:
-                        blank_lines += 1
-                        continue
-                        
-                    # Handle docstrings
-                    if stripped.startswith('"""') or stripped.startswith("'''"):
-                        in_docstring = not in_docstring
-                        doc_lines += 1
-                        continue
-                    
-                    if in_docstring:
-                        doc_lines += 1
-                        continue
-                        
-                    # Handle imports
-                    if stripped.startswith('import ') or stripped.startswith('from '):
-                        import_lines += 1
-                        continue
-                        
-                    # Handle comments
-                    if stripped.startswith('#'):
-                        continue
-                        
-                    code_lines += 1
-                
                 # Calculate effective LOC and complexity ratio
-                effective_loc = code_lines
-                complexity_ratio = effective_loc / (len(lines) - blank_lines) if len(lines) - blank_lines > 0 else 1
+                effective_loc = stats.code
+                non_blank_lines = stats.total - stats.blank
+                complexity_ratio = effective_loc / non_blank_lines if non_blank_lines > 0 else 1
                 
                 # Adjust threshold based on module type
                 adjusted_threshold = self.thresholds['LOC_THRESHOLD']
@@ -765,8 +1479,8 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
                     self.add_smell(
                         name="High Lines of Code (LOC)",
                         description=f"Module '{module_name}' has {effective_loc} effective code lines\n"
-                        f"(Total: {len(lines)}, Code: {code_lines}, Doc: {doc_lines}, "
-                        f"Import: {import_lines}, Blank: {blank_lines})",
+                        f"(Total: {stats.total}, Code: {stats.code}, Doc: {stats.doc}, "
+                        f"Import: {stats.imports}, Blank: {stats.blank})",
                         file_path=file_path,
                         module_class=module_name,
                         severity=severity
@@ -785,32 +1499,18 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         - Internal vs external coupling
         - Framework-specific patterns
         """
-        standard_lib_prefixes = {'os.', 'sys.', 'datetime.', 'collections.', 'json.', 'logging.'}
-        framework_patterns = {'get_', 'set_', 'is_', 'has_', '__'}
-        
         for class_name, info in self.class_info.items():
-            # Track unique external calls and their frequencies
-            method_calls = defaultdict(int)
-            internal_calls = set()
+            method_names = frozenset(m.name for m in info.methods)
+            # Skip standard library calls and framework-specific patterns
+            calls = [call for calls in info.method_calls.values() for call in calls
+                     if not call.startswith(_MPC_SKIPPED_PREFIXES)]
             
-            for method_name, calls in info['method_calls'].items():
-                for call in calls:
-                    # Skip standard library calls
-                    if any(call.startswith(prefix) for prefix in standard_lib_prefixes):
-                        continue
-                        
-                    # Skip framework-specific patterns
-                    if any(call.startswith(pattern) for pattern in framework_patterns):
-                        continue
-                        
-                    # Track internal vs external calls
-                    if any(m.name == call for m in info['methods']):
-                        internal_calls.add(call)
-                    else:
-                        method_calls[call] += 1
+            # Track internal calls, and unique external calls with their frequencies
+            internal_calls = method_names.intersection(calls)
+            method_calls = Counter(call for call in calls if call not in method_names)
             
             # Calculate weighted MPC
-            external_mpc = sum(freq for freq in method_calls.values())
+            external_mpc = sum(method_calls.values())
             internal_mpc = len(internal_calls)
             weighted_mpc = external_mpc * 1.5 + internal_mpc  # External calls weighted more heavily
             
@@ -820,8 +1520,8 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
                     "High Message Passing Coupling (MPC)",
                     f"Class '{class_name}' has weighted MPC of {weighted_mpc:.1f}\n"
                     f"(External calls: {external_mpc}, Internal calls: {internal_mpc})\n"
-                    f"Most frequent external calls: {dict(sorted(method_calls.items(), key=lambda x: x[1], reverse=True)[:3])}",
-                    self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
+                    f"Most frequent external calls: {dict(method_calls.most_common(3))}",
+                    self.class_to_file.get(class_name, "Unknown"),
                     class_name,
                     severity=severity
                 )
@@ -836,32 +1536,23 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         - Internal vs external coupling
         - Strength of coupling
         """
-        standard_libs = {'os', 'sys', 'datetime', 'collections', 'json', 'logging', 're', 'math'}
-        framework_patterns = {'test_', 'mock_', 'stub_', 'fake_'}
-        
         for class_name, info in self.class_info.items():
             # Track different types of coupling
             direct_coupling = set()
             indirect_coupling = set()
             
             # Analyze method calls and attribute access
-            for method in info['methods']:
-                for node in ast.walk(method):
-                    if isinstance(node, ast.Call):
-                        if isinstance(node.func, ast.Attribute):
-                            # Get the base object being called
-                            base_obj = self._get_base_object(node.func)
-                            if base_obj and not self._is_excluded_dependency(base_obj, standard_libs, framework_patterns):
-                                direct_coupling.add(base_obj)
-                    
-                    elif isinstance(node, ast.Attribute):
-                        base_obj = self._get_base_object(node)
-                        if base_obj and not self._is_excluded_dependency(base_obj, standard_libs, framework_patterns):
-                            indirect_coupling.add(base_obj)
+            for method in info.methods:
+                for base_obj in method.call_bases:
+                    if base_obj and not self._is_excluded_dependency(base_obj):
+                        direct_coupling.add(base_obj)
+                for base_obj in method.attribute_bases:
+                    if base_obj and not self._is_excluded_dependency(base_obj):
+                        indirect_coupling.add(base_obj)
             
             # Analyze inheritance and composition
-            for base in info['base_classes']:
-                if not self._is_excluded_dependency(base, standard_libs, framework_patterns):
+            for base in info.base_classes:
+                if not self._is_excluded_dependency(base):
                     direct_coupling.add(base)
             
             # Calculate weighted CBO
@@ -877,7 +1568,7 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
                     f"Direct coupling: {direct_cbo} classes\n"
                     f"Indirect coupling: {indirect_cbo} classes\n"
                     f"Most significant dependencies: {sorted(direct_coupling)[:3]}",
-                    self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
+                    self.class_to_file.get(class_name, "Unknown"),
                     class_name,
                     severity=severity
                 )
@@ -892,43 +1583,22 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         Returns:
             str: The base object name, or None if it cannot be determined.
         """
-        if isinstance(node, ast.Attribute):
-            if isinstance(node.value, ast.Name):
-                if node.value.id != 'self':
-                    return node.value.id
-            elif isinstance(node.value, ast.Attribute):
-                return self._get_base_object(node.value)
-        return None
+        return _base_object_name(node)
 
-    def _is_excluded_dependency(self, name, standard_libs, framework_patterns):
+    def _is_excluded_dependency(self, name):
         """
         Check if a dependency should be excluded from coupling calculations.
+
+        Standard library modules, framework/test helpers, utility/helper classes
+        and common base classes are excluded.
         
         Args:
             name (str): The name to check.
-            standard_libs (set): Set of standard library names.
-            framework_patterns (set): Set of framework-specific patterns.
             
         Returns:
             bool: True if the dependency should be excluded, False otherwise.
         """
-        # Check standard library
-        if any(name.startswith(lib) for lib in standard_libs):
-            return True
-            
-        # Check framework patterns
-        if any(pattern in name.lower() for pattern in framework_patterns):
-            return True
-            
-        # Check utility/helper classes
-        if 'utils' in name.lower() or 'helper' in name.lower():
-            return True
-            
-        # Check common base classes
-        if name in {'object', 'Exception', 'dict', 'list', 'set'}:
-            return True
-            
-        return False
+        return name in _CBO_EXCLUDED_NAMES or _CBO_EXCLUDED_RE.search(name) is not None
 
     def _calculate_cbo_severity(self, weighted_cbo, threshold):
         """
@@ -1018,11 +1688,13 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         """
         base_threshold = self.thresholds['NOC_THRESHOLD']
         
-        # Count total lines of production code
-        total_loc = sum(info['loc'] for info in self.module_info.values()
-                       if not any(pattern in name.lower() 
-                                for pattern in ['test', 'mock'] 
-                                for name in info))
+        # Count total lines of production code, leaving out test and mock modules
+        if self._total_production_loc is None:
+            self._total_production_loc = sum(
+                info['loc'] for module_name, info in self.module_info.items()
+                if not any(pattern in module_name.lower() for pattern in ('test', 'mock'))
+            )
+        total_loc = self._total_production_loc
         
         # Adjust based on project size
         if total_loc > 10000:
@@ -1055,20 +1727,7 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         Returns:
             str: The resolved base class name
         """
-        if isinstance(base_node, ast.Name):
-            return base_node.id
-        elif isinstance(base_node, ast.Attribute):
-            # Handle module.class syntax
-            return f"{self._get_base_object(base_node)}.{base_node.attr}"
-        return str(base_node)
-
-    def _get_base_object(self, node):
-        """Helper method to get the base object name from an attribute node."""
-        if isinstance(node.value, ast.Name):
-            return node.value.id
-        elif isinstance(node.value, ast.Attribute):
-            return self._get_base_object(node.value)
-        return str(node.value)
+        return _resolve_base_class(base_node)
 
     def detect_cyclomatic_complexity(self):
         """
@@ -1076,12 +1735,12 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         Uses a simplified calculation based on control flow statements.
         """
         for class_name, info in self.class_info.items():
-            for method in info['methods']:
+            for method in info.methods:
                 # Skip special methods
-                if method.name.startswith('__') and method.name.endswith('__'):
+                if method.is_special:
                     continue
                     
-                complexity = self.calculate_cyclomatic_complexity(method)
+                complexity = method.cc
                 threshold = self.thresholds.get('CYCLOMATIC_COMPLEXITY_THRESHOLD', 10)
                 
                 if complexity > threshold:
@@ -1089,7 +1748,7 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
                     self.add_smell(
                         "High Cyclomatic Complexity",
                         f"Method '{method.name}' has cyclomatic complexity of {complexity}",
-                        self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
+                        self.class_to_file.get(class_name, "Unknown"),
                         class_name,
                         method.lineno,
                         severity=severity
@@ -1107,29 +1766,21 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         - except blocks
         - boolean operations (and, or)
         
+        The value is computed once per method: MethodInfo entries carry it
+        already, and the values of AST nodes are memoized by the detector, with
+        weak references so the trees are not kept alive.
+
         Args:
-            method (ast.FunctionDef): The method to analyze
+            method (MethodInfo or ast.FunctionDef): The method to analyze
             
         Returns:
             int: The cyclomatic complexity value
         """
-        complexity = 1  # Base complexity
-        
-        for node in ast.walk(method):
-            # Control flow statements
-            if isinstance(node, ast.If):
-                complexity += 1
-                # Count elif branches
-                complexity += len([1 for handler in node.orelse 
-                                 if isinstance(handler, ast.If)])
-            elif isinstance(node, (ast.For, ast.While)):
-                complexity += 1
-            elif isinstance(node, ast.ExceptHandler):
-                complexity += 1
-            # Boolean operations
-            elif isinstance(node, ast.BoolOp):
-                complexity += len(node.values) - 1
-                
+        if isinstance(method, MethodInfo):
+            return method.cc
+        complexity = self._complexity_cache.get(method)
+        if complexity is None:
+            complexity = self._complexity_cache[method] = _MethodFacts(method).cc
         return complexity
 
     def detect_fanout(self):
@@ -1137,18 +1788,20 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         Detect modules with high fan-out (too many outgoing dependencies).
         Excludes standard library and test dependencies.
         """
-        standard_libs = {'os', 'sys', 'datetime', 'collections', 'json', 'logging'}
+        threshold = self.thresholds.get('MAX_FANOUT', 15)
+        _, out_degrees = self._dependency_degrees()
         
-        for module in self.dependency_graph.nodes():
-            # Skip test modules
-            if 'test' in module.lower():
+        for module, out_degree in out_degrees.items():
+            # Skip test modules, and modules that cannot exceed the threshold
+            if out_degree <= threshold or 'test' in module.lower():
                 continue
                 
             # Count only non-standard library dependencies
-            significant_deps = sum(1 for successor in self.dependency_graph.successors(module)
-                                 if not any(successor.startswith(lib) for lib in standard_libs))
+            significant_deps = 0
+            for successor in self.dependency_graph.successors(module):
+                if successor not in _FANOUT_STDLIB_MODULES and not successor.startswith(_FANOUT_STDLIB_PREFIXES):
+                    significant_deps += 1
             
-            threshold = self.thresholds.get('MAX_FANOUT', 15)
             if significant_deps > threshold:
                 severity = 'High' if significant_deps > threshold * 1.5 else 'Medium'
                 self.add_smell(
@@ -1159,18 +1812,33 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
                     severity=severity
                 )
 
+    def _dependency_degrees(self):
+        """
+        Get the in- and out-degree of every module in the dependency graph.
+
+        The degrees are computed once per analysis and shared by the fan-in and
+        fan-out detectors.
+
+        Returns:
+            tuple: (in-degree dict, out-degree dict), keyed by module name.
+        """
+        if self._degrees is None:
+            self._degrees = (dict(self.dependency_graph.in_degree()),
+                             dict(self.dependency_graph.out_degree()))
+        return self._degrees
+
     def detect_fanin(self):
         """
         Detect modules with high fan-in (too many incoming dependencies).
         Excludes utility classes and base classes which are meant to be widely used.
         """
-        for module in self.dependency_graph.nodes():
+        threshold = self.thresholds.get('MAX_FANIN', 15)
+        in_degrees, _ = self._dependency_degrees()
+        
+        for module, fanin in in_degrees.items():
             # Skip utility and base modules which are meant to have high fan-in
             if any(pattern in module.lower() for pattern in ['util', 'base', 'common', 'interface']):
                 continue
-                
-            fanin = self.dependency_graph.in_degree(module)
-            threshold = self.thresholds.get('MAX_FANIN', 15)
             
             if fanin > threshold:
                 severity = 'High' if fanin > threshold * 1.5 else 'Medium'
@@ -1188,41 +1856,12 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         """
         for module_name, info in self.module_info.items():
             try:
-                file_path = self.file_paths.get(module_name, "")
-                if not file_path or not os.path.exists(file_path):
+                stats = self._compute_line_stats(module_name)
+                if stats is None:
                     continue
+                file_path = self.file_paths[module_name]
 
-                # Try different encodings
-                encodings = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252']
-                content = None
-                
-                for encoding in encodings:
-                    try:
-                        with open(file_path, 'r', encoding=encoding) as file:
-                            content = file.read()
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                
-                if content is None:
-                    logger.warning(f"Could not read file {file_path} with any supported encoding")
-                    continue
-
-                # Count meaningful lines
-                lines = content.splitlines()
-                meaningful_lines = 0
-                in_docstring = False
-                
-                for line in lines:
-                    stripped = line.strip()
-                    if not stripped or stripped.startswith('#'):
-                        continue
-                    if stripped.startswith('"""') or stripped.startswith("'''"):
-                        in_docstring = not in_docstring
-                        continue
-                    if not in_docstring:
-                        meaningful_lines += 1
-                
+                meaningful_lines = stats.meaningful
                 threshold = self.thresholds.get('MAX_FILE_LENGTH', 250)
                 if meaningful_lines > threshold:
                     severity = 'High' if meaningful_lines > threshold * 1.5 else 'Medium'
@@ -1243,24 +1882,21 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         Excludes certain types of methods and considers nesting level.
         """
         for class_name, info in self.class_info.items():
-            for method in info['methods']:
+            for method in info.methods:
                 # Skip property methods and simple getters/setters
-                if (any(isinstance(d, ast.Name) and d.id == 'property' 
-                       for d in getattr(method, 'decorator_list', [])) or
-                    method.name.startswith(('get_', 'set_', 'is_'))):
+                if method.is_property or method.name.startswith(('get_', 'set_', 'is_')):
                     continue
                     
-                branch_info = self._analyze_branches(method)
                 threshold = self.thresholds.get('MAX_BRANCHES', 10)
                 
                 # Consider both count and nesting
-                if branch_info['count'] > threshold or branch_info['max_nesting'] > 3:
-                    severity = 'High' if branch_info['count'] > threshold * 1.5 else 'Medium'
+                if method.branch_count > threshold or method.max_nesting > 3:
+                    severity = 'High' if method.branch_count > threshold * 1.5 else 'Medium'
                     self.add_smell(
                         "Too Many Branches",
-                        f"Method '{method.name}' has {branch_info['count']} branches "
-                        f"with max nesting of {branch_info['max_nesting']}",
-                        self.file_paths.get(class_name.rsplit('.', 1)[0], "Unknown"),
+                        f"Method '{method.name}' has {method.branch_count} branches "
+                        f"with max nesting of {method.max_nesting}",
+                        self.class_to_file.get(class_name, "Unknown"),
                         class_name,
                         method.lineno,
                         severity=severity
@@ -1276,42 +1912,23 @@ Success rate: {((files_analyzed - files_with_errors) / max(files_analyzed, 1) *
         Returns:
             dict: Contains branch count and maximum nesting level
         """
-        branch_count = 0
-        max_nesting = 0
-        current_nesting = 0
-        
-        for node in ast.walk(method):
-            if isinstance(node, (ast.If, ast.For, ast.While, ast.Try)):
-                branch_count += 1
-                current_nesting += 1
-                max_nesting = max(max_nesting, current_nesting)
-                
-                # Add elif branches for if statements
-                if isinstance(node, ast.If):
-                    branch_count += len([1 for handler in node.orelse 
-                                       if isinstance(handler, ast.If)])
-                # Add except blocks for try statements
-                elif isinstance(node, ast.Try):
-                    branch_count += len(node.handlers)
-                    
-            # Decrease nesting level when leaving a node
-            elif isinstance(node, ast.FunctionDef) and node != method:
-                current_nesting = max(0, current_nesting - 1)
-                
+        facts = _MethodFacts(method)
         return {
-            'count': branch_count,
-            'max_nesting': max_nesting
+            'count': facts.branch_count,
+            'max_nesting': facts.max_nesting
         }
 
-def analyze_structure(directory_path, config):
+def analyze_structure(directory_path, config, jobs=None, cache_dir=DEFAULT_CACHE_DIR):
     """
     Analyze the structural smells in a given directory.
 
     Args:
         directory_path (str): The path to the directory to analyze.
         config (dict or str): Either a dictionary of thresholds or a path to a YAML config file.
+        jobs (int, optional): Number of worker processes used to parse files.
+        cache_dir (str, optional): Directory of the facts and results cache, or None to disable it.
     """
-    detector = StructuralSmellDetector(config)
+    detector = StructuralSmellDetector(config, jobs=jobs, cache_dir=cache_dir, cache_results=True)
     detector.detect_smells(directory_path)
     detector.print_report()
 
@@ -1320,6 +1937,8 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Detect structural smells in Python code.")
     parser.add_argument("directory", help="Directory path to analyze")
     parser.add_argument("--config", default="code_quality_config.yaml", help="Path to the configuration file")
+    parser.add_argument("--jobs", type=int, help="Number of worker processes (defaults to the CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the analysis cache")
     args = parser.parse_args()
 
-    analyze_structure(args.directory, args.config)
\ No newline at end of file
+    analyze_structure(args.directory, args.config, args.jobs, None if args.no_cache else DEFAULT_CACHE_DIR)
\ No newline at end of file
@@ -1,5 +1,6 @@
+import os
 import pytest
-from code_quality_analyzer.architectural_smell_detector import ArchitecturalSmellDetector
+from code_quality_analyzer.architectural_smell_detector import ArchitecturalSmellDetector, analyze_architecture
 from code_quality_analyzer.config_handler import ConfigHandler
 
 @pytest.fixture
@@ -45,4 +46,96 @@ def test_detect_improper_api_usage(architectural_smell_detector, tmp_path):
     assert any("Improper API Usage" in smell.name for smell in architectural_smell_detector.architectural_smells)
 
 
+def test_facts_cache_is_reused(config_handler, tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "module.py").write_text("import os\nfrom .helpers import run\n\ndef main():\n    os.getcwd()\n")
+    cache_dir = str(tmp_path / "cache")
+    thresholds = config_handler.get_thresholds('architectural_smells')
+
+    first = ArchitecturalSmellDetector(thresholds, cache_dir=cache_dir)
+    first.detect_smells(str(project))
+    assert any(files for _, _, files in os.walk(cache_dir))
+
+    second = ArchitecturalSmellDetector(thresholds, cache_dir=cache_dir)
+    second.detect_smells(str(project))
+    assert second.file_paths == first.file_paths
+    assert dict(second.module_functions) == dict(first.module_functions)
+    assert dict(second.function_calls) == dict(first.function_calls)
+    assert list(second.module_dependencies.edges()) == list(first.module_dependencies.edges())
+
+
+def test_tool_directories_are_skipped(architectural_smell_detector, tmp_path):
+    (tmp_path / "module.py").write_text("import os\n")
+    venv = tmp_path / ".venv" / "lib"
+    venv.mkdir(parents=True)
+    (venv / "installed.py").write_text("import sys\n")
+
+    architectural_smell_detector.analyze_directory(str(tmp_path))
+    assert list(architectural_smell_detector.file_paths) == [f"{tmp_path.name}.module"]
+
+
+def test_only_skipped_files(architectural_smell_detector, tmp_path):
+    (tmp_path / "msg_pb2.py").write_text("import os\n")
+
+    architectural_smell_detector.detect_smells(str(tmp_path))
+    assert not architectural_smell_detector.file_paths
+    assert not architectural_smell_detector.architectural_smells
+
+
+def test_external_dependencies_leave_the_graph(architectural_smell_detector, tmp_path):
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "a.py").write_text("import os\nimport yaml\nimport pkg.b\n")
+    (package / "b.py").write_text("import json\n")
+
+    architectural_smell_detector.analyze_directory(str(package))
+    assert list(architectural_smell_detector.module_dependencies.edges()) == [('pkg.a', 'pkg.b')]
+    assert set(architectural_smell_detector.module_dependencies) == {'pkg.a', 'pkg.b'}
+    assert architectural_smell_detector.external_dependencies['pkg.a'] == {('stdlib', 'os'), ('third_party', 'yaml')}
+    assert architectural_smell_detector.external_dependencies['pkg.b'] == {('stdlib', 'json')}
+
+
+def test_analyze_architecture_loads_thresholds(tmp_path, capsys):
+    (tmp_path / "god_object.py").write_text("\n".join([f"def func{i}(): pass" for i in range(26)]))
+
+    analyze_architecture(str(tmp_path), 'code_quality_config.yaml')
+    assert "God Object" in capsys.readouterr().out
+
+
+def test_cycle_strength_counts_mutual_dependencies(architectural_smell_detector):
+    graph = architectural_smell_detector.module_dependencies
+    graph.add_edges_from([('a', 'b'), ('b', 'a'), ('b', 'c'), ('c', 'a'), ('core', 'a'), ('a', 'core')])
+
+    architectural_smell_detector.detect_cyclic_dependencies()
+    strengths = sorted(smell.description.splitlines()[1] for smell in architectural_smell_detector.architectural_smells)
+    assert strengths == ["Cycle strength: 1 mutual dependencies", "Cycle strength: 2 mutual dependencies"]
+
+
+def test_unstable_threshold_is_only_needed_for_qualifying_modules():
+    detector = ArchitecturalSmellDetector({'MIN_DEPENDENCIES': 5})
+    detector.module_dependencies.add_edges_from([('a', 'b'), ('b', 'c')])
+
+    detector.detect_unstable_dependencies()
+    assert not detector.architectural_smells
+
+
+def test_stdlib_dependencies_match_top_level_names(architectural_smell_detector, tmp_path):
+    package = tmp_path / "pkg"
+    package.mkdir()
+    # astroid and osmnx_missing only start like the stdlib ast and os modules
+    (package / "a.py").write_text("import os.path\nimport _thread\nimport astroid\nimport osmnx_missing\n")
+
+    architectural_smell_detector.analyze_directory(str(package))
+    assert architectural_smell_detector.external_dependencies['pkg.a'] == {
+        ('stdlib', 'os.path'), ('stdlib', '_thread'), ('third_party', 'astroid')
+    }
+
+
+def test_functions_and_imports_merge_in_traversal_order(architectural_smell_detector, tmp_path):
+    package = tmp_path / "pkg"
+    package.mkdir()
+    (package / "a.py").write_text("def first(): pass\nfrom lib import helper\n")
 
+    architectural_smell_detector.analyze_directory(str(package))
+    assert list(architectural_smell_detector.module_functions) == ['pkg.a', 'lib']
@@ -0,0 +1,50 @@
+import csv
+from code_quality_analyzer.main import ReportWriter, analyze_architectural_smells, generate_report
+from code_quality_analyzer.architectural_smell_detector import ArchitecturalSmell, ArchitecturalSmellDetector
+from code_quality_analyzer.structural_smell_detector import StructuralSmell
+
+def test_report_writer_streams_smells(tmp_path):
+    output_txt = tmp_path / "report.txt"
+    output_csv = tmp_path / "report.csv"
+    writer = ReportWriter(str(output_txt), str(output_csv), maxsize=2).start()
+
+    stream = writer.stream('Architectural')
+    for i in range(5):
+        stream.append(ArchitecturalSmell(f"Smell {i}", "description", "file.py", f"module{i}"))
+    writer.close()
+
+    assert len(stream) == 5
+    report = output_txt.read_text()
+    assert "Architectural Smells:" in report
+    # Sections come in the same order as in generate_report
+    assert (report.index("No structural smells detected.") < report.index("No code smells detected.")
+            < report.index("Architectural Smells:"))
+    assert "Total Architectural Smells: 5" in report
+    with open(output_csv, newline='') as csvfile:
+        rows = list(csv.DictReader(csvfile))
+    assert [row['Name'] for row in rows] == [f"Smell {i}" for i in range(5)]
+    assert all(row['Type'] == 'Architectural' for row in rows)
+
+def test_analyze_architectural_smells_streams_smells(tmp_path):
+    (tmp_path / "god_object.py").write_text("\n".join(f"def func{i}(): pass" for i in range(26)))
+    writer = ReportWriter(str(tmp_path / "report.txt"), str(tmp_path / "report.csv")).start()
+    detector = ArchitecturalSmellDetector(ArchitecturalSmellDetector.load_thresholds('code_quality_config.yaml'))
+    detector.architectural_smells = writer.stream('Architectural')
+
+    assert len(analyze_architectural_smells(str(tmp_path), detector)) == 1
+    writer.close()
+    assert "Total Architectural Smells: 1" in (tmp_path / "report.txt").read_text()
+
+def test_streamed_report_matches_generated_report(tmp_path):
+    architectural = [ArchitecturalSmell(f"Smell {i}", "description", "file.py", f"module{i}") for i in range(3)]
+    structural = [StructuralSmell("High LOC", "description", "file.py", "module", line_number=1)]
+
+    # Structural smells arrive after the architectural ones
+    writer = ReportWriter(str(tmp_path / "streamed.txt"), str(tmp_path / "streamed.csv")).start()
+    writer.stream('Architectural').extend(architectural)
+    writer.stream('Structural').extend(structural)
+    writer.close()
+    generate_report([], architectural, structural, str(tmp_path / "generated.txt"), str(tmp_path / "generated.csv"))
+
+    assert (tmp_path / "streamed.txt").read_bytes() == (tmp_path / "generated.txt").read_bytes()
+    assert (tmp_path / "streamed.csv").read_bytes() == (tmp_path / "generated.csv").read_bytes()
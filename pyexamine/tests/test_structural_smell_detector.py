@@ -1,5 +1,8 @@
+import ast
+import os
 import pytest
-from code_quality_analyzer.structural_smell_detector import StructuralSmellDetector
+from code_quality_analyzer import structural_smell_detector as structural_smell_detector_module
+from code_quality_analyzer.structural_smell_detector import ClassRecord, StructuralSmellDetector, _MethodFacts
 from code_quality_analyzer.config_handler import ConfigHandler
 
 @pytest.fixture
@@ -30,3 +33,172 @@ def test_detect_noc(structural_smell_detector, tmp_path):
     structural_smell_detector.detect_smells(str(tmp_path))
     assert any("High Number of Classes (NOC)" in smell.name for smell in structural_smell_detector.structural_smells)
 
+
+def test_generated_and_empty_files_are_not_parsed(structural_smell_detector, tmp_path):
+    (tmp_path / "__init__.py").write_text("")
+    generated = tmp_path / "messages_pb2.py"
+    generated.write_text("\n".join([f"print({i})" for i in range(1001)]))
+
+    structural_smell_detector.detect_smells(str(tmp_path))
+    assert "__init__" in structural_smell_detector.module_info
+    assert "messages_pb2" not in structural_smell_detector.module_info
+    assert not any("High Lines of Code (LOC)" in smell.name for smell in structural_smell_detector.structural_smells)
+
+
+def test_empty_files_count_as_analyzed(structural_smell_detector, tmp_path, caplog):
+    (tmp_path / "__init__.py").write_text("")
+
+    with caplog.at_level('INFO'):
+        structural_smell_detector.analyze_directory(str(tmp_path))
+    assert "Files analyzed: 1" in caplog.text
+    assert "No Python files were successfully analyzed!" not in caplog.text
+
+
+def test_parallel_parsing_matches_serial(config_handler, tmp_path):
+    for i in range(40):
+        module = tmp_path / f"module{i}.py"
+        module.write_text(f"import module{(i + 1) % 40}\n\nclass Class{i}:\n    def run(self, x):\n        if x:\n            return self.value\n")
+
+    thresholds = config_handler.get_thresholds('structural_smells')
+    serial = StructuralSmellDetector(thresholds, jobs=1)
+    parallel = StructuralSmellDetector(thresholds, jobs=2)
+    serial.detect_smells(str(tmp_path))
+    parallel.detect_smells(str(tmp_path))
+
+    assert sorted(parallel.module_info) == sorted(serial.module_info)
+    assert sorted(parallel.dependency_graph.edges()) == sorted(serial.dependency_graph.edges())
+    assert sorted(str(s) for s in parallel.structural_smells) == sorted(str(s) for s in serial.structural_smells)
+
+
+def test_facts_cache_is_reused(config_handler, tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "module.py").write_text("import os\n\nclass Example:\n    def run(self):\n        return self.value\n")
+    cache_dir = str(tmp_path / "cache")
+    thresholds = config_handler.get_thresholds('structural_smells')
+
+    first = StructuralSmellDetector(thresholds, jobs=1, cache_dir=cache_dir)
+    first.detect_smells(str(project))
+    assert any(files for _, _, files in os.walk(cache_dir))
+
+    second = StructuralSmellDetector(thresholds, jobs=1, cache_dir=cache_dir)
+    second.detect_smells(str(project))
+    assert second.class_info.keys() == first.class_info.keys()
+    assert second.file_paths == first.file_paths
+    assert list(second.dependency_graph.edges()) == list(first.dependency_graph.edges())
+
+
+def test_results_cache_skips_unchanged_projects(config_handler, tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    module = project / "module.py"
+    module.write_text("\n".join(f"print({i})" for i in range(1001)))
+    cache_dir = str(tmp_path / "cache")
+    thresholds = config_handler.get_thresholds('structural_smells')
+
+    first = StructuralSmellDetector(thresholds, jobs=1, cache_dir=cache_dir, cache_results=True)
+    first.detect_smells(str(project))
+    assert first.structural_smells
+
+    second = StructuralSmellDetector(thresholds, jobs=1, cache_dir=cache_dir, cache_results=True)
+    second.detect_smells(str(project))
+    assert second.structural_smells == first.structural_smells
+    assert not second.module_info
+
+    module.write_text("print(0)\n")
+    third = StructuralSmellDetector(thresholds, jobs=1, cache_dir=cache_dir, cache_results=True)
+    third.detect_smells(str(project))
+    assert third.module_info
+    assert not any("LOC" in smell.name for smell in third.structural_smells)
+
+
+def test_cyclomatic_complexity_is_memoized(structural_smell_detector, monkeypatch):
+    method = ast.parse("def f(self, x):\n    if x and self.y:\n        return 1\n    return 0\n").body[0]
+    walked = []
+
+    def counting_method_facts(node):
+        walked.append(node)
+        return _MethodFacts(node)
+    monkeypatch.setattr(structural_smell_detector_module, '_MethodFacts', counting_method_facts)
+
+    assert structural_smell_detector.calculate_cyclomatic_complexity(method) == 3
+    assert structural_smell_detector.calculate_cyclomatic_complexity(method) == 3
+    assert walked == [method]
+
+
+def test_calls_in_nested_functions_are_not_attributed_to_method(structural_smell_detector, tmp_path):
+    (tmp_path / "module.py").write_text(
+        "class Example:\n"
+        "    def run(self):\n"
+        "        self.start()\n"
+        "        def callback():\n"
+        "            self.stop()\n"
+        "        return lambda: client.reset()\n"
+    )
+
+    structural_smell_detector.detect_smells(str(tmp_path))
+    assert structural_smell_detector.class_info['module.Example'].method_calls['run'] == {'start'}
+    # The objects they use still count for coupling
+    assert 'client' in structural_smell_detector.class_info['module.Example'].methods[0].call_bases
+
+
+def test_propagate_masks_follows_cycles():
+    from code_quality_analyzer.structural_smell_detector import _propagate_masks
+
+    # 0 -> 1 <-> 2 -> 3, 4 isolated
+    masks = [0b00001, 0b00010, 0b00100, 0b01000, 0b10000]
+    successors = [[1], [2], [1, 3], [], []]
+    assert _propagate_masks(masks, successors) == [0b01111, 0b01110, 0b01110, 0b01000, 0b10000]
+
+
+def test_line_stats_count_line_kinds(tmp_path):
+    from code_quality_analyzer.structural_smell_detector import _read_line_stats
+
+    source = (
+        '"""Module docstring\n'
+        '# not a comment here\n'
+        '"""\n'
+        'import os\n'
+        '\n'
+        '# comment\n'
+        'x = 1\n'
+    )
+    ascii_file = tmp_path / "ascii_module.py"
+    ascii_file.write_bytes(source.encode())
+    stats = _read_line_stats(str(ascii_file))
+    assert stats == (7, 1, 3, 1, 1)
+    assert stats.meaningful == 2
+
+    # Lines are stripped as text, so a comment indented with a non-breaking space is still a comment
+    unicode_file = tmp_path / "unicode_module.py"
+    unicode_file.write_bytes((source + '\u00a0# caf\u00e9\n').encode())
+    assert _read_line_stats(str(unicode_file)) == (8, 1, 3, 1, 1)
+
+
+def test_base_object_skips_self(structural_smell_detector):
+    assert structural_smell_detector._get_base_object(ast.parse("requests.sessions.get").body[0].value) == 'requests'
+    assert structural_smell_detector._get_base_object(ast.parse("self.client.session.get").body[0].value) is None
+    assert structural_smell_detector._get_base_object(ast.parse("make().attr").body[0].value) is None
+
+
+def test_noc_threshold_ignores_test_modules(structural_smell_detector):
+    structural_smell_detector.module_info['pkg.core']['loc'] = 100
+    structural_smell_detector.module_info['tests.test_core']['loc'] = 20000
+
+    assert structural_smell_detector._adjust_noc_threshold() == structural_smell_detector.thresholds['NOC_THRESHOLD']
+
+
+def test_nocc_accepts_records_added_directly(structural_smell_detector):
+    structural_smell_detector.class_info['pkg.module.Injected'] = ClassRecord(base_classes=['Base'])
+
+    structural_smell_detector.detect_nocc()
+    assert structural_smell_detector.class_info['pkg.module.Injected']['base_classes'] == ['Base']
+
+
+def test_count_lines_follows_splitlines():
+    from code_quality_analyzer.structural_smell_detector import _count_lines
+
+    assert _count_lines(b"a = 1\nb = 2") == 2
+    assert _count_lines(b"a = 1\rb = 2\r") == 2
+    assert _count_lines(b"a = 1\r\nb = 2\r\n") == 2
+    assert _count_lines("a = 1\x0cb = 2 c = 3\n".encode()) == 3